@@ -8,6 +8,8 @@ import (
 	"os"
 	"path/filepath"
 	"testing"
+
+	"github.com/go-enry/go-enry/v2/internal/tokenizer"
 )
 
 type sample struct {
@@ -103,6 +105,38 @@ func BenchmarkClassifyTotal(b *testing.B) {
 	})
 }
 
+func BenchmarkClassifyWithMargin(b *testing.B) {
+	if slow {
+		b.SkipNow()
+	}
+
+	// a big header, made of every sample header, for which C, C++ and Objective-C are candidates
+	var content []byte
+	for _, sample := range samples {
+		if filepath.Ext(sample.filename) == ".h" {
+			content = append(content, sample.content...)
+		}
+	}
+	if len(content) == 0 {
+		b.Skip("no .h samples")
+	}
+	for len(content) < tokenizer.ByteLimit {
+		content = append(content, content...)
+	}
+	candidates := map[string]float64{"C": 1, "C++": 1, "Objective-C": 1}
+
+	var o []string
+	for _, margin := range []float64{0, 10} {
+		b.Run(fmt.Sprintf("margin=%v", margin), func(b *testing.B) {
+			for n := 0; n < b.N; n++ {
+				o = defaultNaiveBayes.classifyWithMargin(content, candidates, margin)
+			}
+
+			overcomeLanguages = o
+		})
+	}
+}
+
 func BenchmarkStrategiesTotal(b *testing.B) {
 	if slow {
 		b.SkipNow()
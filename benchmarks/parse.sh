@@ -2,6 +2,6 @@
 set -e
 
 cd benchmarks/output
-go run ../parser/main.go -outdir ../csv
+go run ../parser -outdir ../csv
 cd ../csv
-go run ../parser/main.go -distribution
+go run ../parser -distribution
@@ -46,8 +46,13 @@ const (
 
 var (
 	// flags
-	distribution bool
-	outDir       string
+	distribution   bool
+	outDir         string
+	throughput     bool
+	baselinePath   string
+	threshold      float64
+	cliThreshold   float64
+	updateBaseline bool
 
 	enryFunctions         = []string{getLanguageFunc, classifyFunc, modelineFunc, filenameFunc, shebangFunc, extensionFunc, contentFunc}
 	distributionIntervals = []string{"1us-10us", "10us-100us", "100us-1ms", "1ms-10ms", "10ms-100ms"}
@@ -56,8 +61,20 @@ var (
 func main() {
 	flag.BoolVar(&distribution, "distribution", false, "generate enry-distribution.csv and linguist-distribution.csv")
 	flag.StringVar(&outDir, "outdir", "", "path to leave csv files")
+	flag.BoolVar(&throughput, "throughput", false, "generate throughput.csv and fail if files/s or p99 latency regressed from the baseline")
+	flag.StringVar(&baselinePath, "baseline", "throughput-baseline.json", "path to the throughput baseline, written if it does not exist")
+	flag.Float64Var(&threshold, "threshold", 0.1, "relative regression tolerated by -throughput")
+	flag.Float64Var(&cliThreshold, "cli-threshold", 0.25, "relative regression tolerated by -throughput for the cli, which starts a process per file")
+	flag.BoolVar(&updateBaseline, "update-baseline", false, "overwrite the throughput baseline with the current results")
 	flag.Parse()
 
+	if throughput {
+		if !checkThroughput(baselinePath, threshold, cliThreshold, updateBaseline) {
+			os.Exit(1)
+		}
+		return
+	}
+
 	if distribution {
 		generateDistributionCSV()
 		return
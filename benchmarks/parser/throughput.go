@@ -0,0 +1,225 @@
+package main
+
+import (
+	"bufio"
+	"encoding/json"
+	"fmt"
+	"io/ioutil"
+	"log"
+	"math"
+	"os"
+	"path/filepath"
+	"sort"
+	"strconv"
+	"strings"
+)
+
+const (
+	// throughput outputs, see benchmarks/run-throughput.sh
+	throughputOutputPattern = "throughput_%s.txt"
+	// file to generate with flag throughput
+	throughputCSV = "throughput.csv"
+)
+
+// throughputTools are the ways the corpus is run through enry.
+var throughputTools = []string{"go", "cli", "python"}
+
+// throughputStats summarizes the timings of a tool: files/s over whole passes
+// on the corpus, and percentiles of the per-file latencies.
+type throughputStats struct {
+	Files       int     `json:"files"`
+	FilesPerSec float64 `json:"filesPerSec"`
+	P50         int64   `json:"p50ns"`
+	P99         int64   `json:"p99ns"`
+}
+
+// checkThroughput summarizes the throughput outputs in the current directory
+// and compares them to the baseline, which is written instead if it does not
+// exist yet or updateBaseline is set. It returns false if any tool regressed
+// by more than threshold, cliThreshold for the cli, or if the timings of any
+// tool are missing.
+func checkThroughput(baselinePath string, threshold, cliThreshold float64, updateBaseline bool) bool {
+	ok := true
+	current := make(map[string]throughputStats, len(throughputTools))
+	for _, tool := range throughputTools {
+		timings, wall, err := readTimings(fmt.Sprintf(throughputOutputPattern, tool))
+		if err != nil {
+			log.Println(err)
+			ok = false
+			continue
+		}
+
+		if len(timings) == 0 || wall.files != len(timings) || wall.ns <= 0 {
+			log.Printf("no timings for %s", tool)
+			ok = false
+			continue
+		}
+
+		current[tool] = summarize(timings, wall)
+	}
+
+	if err := writeCSV(throughputInfoForCSV(current), filepath.Join(outDir, throughputCSV)); err != nil {
+		log.Println(err)
+	}
+
+	if !ok {
+		// an incomplete run can neither become the baseline nor pass the gate
+		return false
+	}
+
+	baseline, err := readBaseline(baselinePath)
+	if os.IsNotExist(err) {
+		updateBaseline = true
+	} else if err != nil {
+		log.Println(err)
+		return false
+	}
+
+	if updateBaseline {
+		if err := writeBaseline(baselinePath, current); err != nil {
+			log.Println(err)
+			return false
+		}
+
+		fmt.Println("baseline written to", baselinePath)
+		return true
+	}
+
+	for _, tool := range throughputTools {
+		cur := current[tool]
+		base, hasBase := baseline[tool]
+		if !hasBase {
+			log.Printf("no baseline for %s in %s", tool, baselinePath)
+			ok = false
+			continue
+		}
+
+		toolThreshold := threshold
+		if tool == "cli" {
+			toolThreshold = cliThreshold
+		}
+
+		fmt.Printf("%s\t%d files\t%.1f files/s (baseline %.1f)\tp99 %dns (baseline %dns)\n",
+			tool, cur.Files, cur.FilesPerSec, base.FilesPerSec, cur.P99, base.P99)
+
+		if cur.FilesPerSec < base.FilesPerSec*(1-toolThreshold) {
+			fmt.Printf("\tREGRESSION: files/s dropped by %.1f%%\n", 100*(1-cur.FilesPerSec/base.FilesPerSec))
+			ok = false
+		}
+
+		if float64(cur.P99) > float64(base.P99)*(1+toolThreshold) {
+			fmt.Printf("\tREGRESSION: p99 latency grew by %.1f%%\n", 100*(float64(cur.P99)/float64(base.P99)-1))
+			ok = false
+		}
+	}
+
+	return ok
+}
+
+// wallTime is the wall-clock time of a pass over the whole corpus.
+type wallTime struct {
+	files int
+	ns    int64
+}
+
+// readTimings parses "<ns>\t<path>" lines of per-file latencies, and the
+// "wall\t<files>\t<ns>" line of the time of a pass over all of them.
+func readTimings(path string) ([]int64, wallTime, error) {
+	var wall wallTime
+	f, err := os.Open(path)
+	if err != nil {
+		return nil, wall, err
+	}
+	defer f.Close()
+
+	var timings []int64
+	buf := bufio.NewScanner(f)
+	for buf.Scan() {
+		fields := strings.SplitN(buf.Text(), "\t", 3)
+		if len(fields) == 3 && fields[0] == "wall" {
+			if wall.files, err = strconv.Atoi(fields[1]); err != nil {
+				return nil, wall, err
+			}
+			if wall.ns, err = strconv.ParseInt(fields[2], 10, 64); err != nil {
+				return nil, wall, err
+			}
+			continue
+		}
+
+		fields = strings.SplitN(buf.Text(), "\t", 2)
+		if len(fields) != 2 {
+			continue
+		}
+
+		ns, err := strconv.ParseInt(fields[0], 10, 64)
+		if err != nil {
+			return nil, wall, err
+		}
+
+		timings = append(timings, ns)
+	}
+
+	return timings, wall, buf.Err()
+}
+
+func summarize(timings []int64, wall wallTime) throughputStats {
+	sorted := append([]int64(nil), timings...)
+	sort.Slice(sorted, func(i, j int) bool { return sorted[i] < sorted[j] })
+
+	return throughputStats{
+		Files:       len(sorted),
+		FilesPerSec: float64(wall.files) / (float64(wall.ns) / 1e9),
+		P50:         percentile(sorted, 50),
+		P99:         percentile(sorted, 99),
+	}
+}
+
+// percentile uses the nearest-rank method on sorted timings.
+func percentile(sorted []int64, p float64) int64 {
+	rank := int(math.Ceil(p / 100 * float64(len(sorted))))
+	if rank < 1 {
+		rank = 1
+	}
+	return sorted[rank-1]
+}
+
+func throughputInfoForCSV(stats map[string]throughputStats) [][]string {
+	firstLine := []string{"tool", "files", "files/s", "p50 ns", "p99 ns"}
+	info := createInfoWithFirstLine(firstLine, len(stats))
+	for _, tool := range throughputTools {
+		s, ok := stats[tool]
+		if !ok {
+			continue
+		}
+
+		info = append(info, []string{
+			tool,
+			strconv.Itoa(s.Files),
+			strconv.FormatFloat(s.FilesPerSec, 'f', 1, 64),
+			strconv.FormatInt(s.P50, 10),
+			strconv.FormatInt(s.P99, 10),
+		})
+	}
+
+	return info
+}
+
+func readBaseline(path string) (map[string]throughputStats, error) {
+	buf, err := ioutil.ReadFile(path)
+	if err != nil {
+		return nil, err
+	}
+
+	var baseline map[string]throughputStats
+	err = json.Unmarshal(buf, &baseline)
+	return baseline, err
+}
+
+func writeBaseline(path string, stats map[string]throughputStats) error {
+	buf, err := json.MarshalIndent(stats, "", "  ")
+	if err != nil {
+		return err
+	}
+
+	return ioutil.WriteFile(path, append(buf, '\n'), 0644)
+}
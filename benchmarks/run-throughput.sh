@@ -0,0 +1,31 @@
+#!/usr/bin/env bash
+# Runs _testdata and linguist samples through the Go library, the enry CLI and
+# the Python bindings, built beforehand with $PYTHON (see make
+# benchmarks-throughput), then fails if files/s over the whole corpus or p99
+# per-file latency regressed by more than THRESHOLD (CLI_THRESHOLD for the CLI,
+# which starts a process per file) from benchmarks/throughput-baseline.json.
+# Pass --update-baseline to record the current results as the new baseline.
+set -e
+
+LINGUIST_PATH="${ENRY_TEST_REPO:-.linguist}"
+THRESHOLD="${THRESHOLD:-0.1}"
+CLI_THRESHOLD="${CLI_THRESHOLD:-0.25}"
+PYTHON="${PYTHON:-python3}"
+ITERATIONS="${ITERATIONS:-5}"
+CLI_ITERATIONS="${CLI_ITERATIONS:-3}"
+OUTPUT=benchmarks/output
+CORPUS=("$PWD/_testdata" "$LINGUIST_PATH/samples")
+
+mkdir -p "$OUTPUT/profiles"
+go build -o "$OUTPUT/enry" ./cmd/enry
+
+go run ./benchmarks/throughput -mode go -iterations "$ITERATIONS" \
+	-profiles "$OUTPUT/profiles" "${CORPUS[@]}" > "$OUTPUT/throughput_go.txt"
+go run ./benchmarks/throughput -mode cli -iterations "$CLI_ITERATIONS" \
+	-enry "$OUTPUT/enry" "${CORPUS[@]}" > "$OUTPUT/throughput_cli.txt"
+PYTHONPATH="$PWD/python${PYTHONPATH:+:$PYTHONPATH}" "$PYTHON" benchmarks/throughput.py --iterations "$ITERATIONS" \
+	--profiles "$OUTPUT/profiles" "${CORPUS[@]}" > "$OUTPUT/throughput_python.txt"
+
+cd "$OUTPUT"
+go run ../parser -throughput -threshold "$THRESHOLD" -cli-threshold "$CLI_THRESHOLD" \
+	-baseline ../throughput-baseline.json "$@"
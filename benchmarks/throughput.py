@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Run a corpus through the enry Python bindings and print the median time spent on
+each file, as "<ns>\t<path>" lines, and the median wall-clock time of a pass over
+the whole corpus, as a "wall\t<files>\t<ns>" line, to be checked by the
+throughput gate of benchmarks/parser.
+
+cProfile profiles of the slowest files, left in --profiles, only cover the
+Python side of the bindings; render them as flame graphs with e.g. flameprof
+or snakeviz.
+"""
+import argparse
+import cProfile
+import os
+import statistics
+import time
+
+import enry
+
+
+def get_samples(root):
+    for dirpath, _, filenames in os.walk(root):
+        for filename in sorted(filenames):
+            path = os.path.join(dirpath, filename)
+            if os.path.isfile(path) and not os.path.islink(path):
+                with open(path, "rb") as f:
+                    yield path, f.read()
+
+
+def detect(path, content):
+    enry.get_language(os.path.basename(path), content)
+
+
+def profile_slowest(timings, samples, profile_dir, slowest, profile_time):
+    os.makedirs(profile_dir, exist_ok=True)
+    ranked = sorted(timings, key=timings.get, reverse=True)[:slowest]
+    for i, path in enumerate(ranked, 1):
+        content = samples[path]
+        profiler = cProfile.Profile()
+        profiler.enable()
+        start = time.perf_counter()
+        while time.perf_counter() - start < profile_time:
+            detect(path, content)
+        profiler.disable()
+        name = "python-%02d-%s.prof" % (i, os.path.basename(path).replace(" ", "_"))
+        profiler.dump_stats(os.path.join(profile_dir, name))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("corpus", nargs="+", help="directories to run through enry")
+    parser.add_argument("--iterations", type=int, default=5,
+                        help="number of timed passes over the corpus, after a warm-up pass")
+    parser.add_argument("--profiles", help="directory to leave cProfile profiles of the slowest files in")
+    parser.add_argument("--slowest", type=int, default=10, help="number of slowest files to profile")
+    parser.add_argument("--profile-time", type=float, default=1.0,
+                        help="seconds spent detecting each profiled file")
+    args = parser.parse_args()
+    if args.iterations < 1:
+        parser.error("--iterations must be at least 1")
+
+    samples = {}
+    for root in args.corpus:
+        samples.update(get_samples(root))
+
+    for path, content in samples.items():
+        detect(path, content)
+
+    times = {path: [] for path in samples}
+    passes = []
+    for _ in range(args.iterations):
+        pass_start = time.perf_counter_ns()
+        for path, content in samples.items():
+            start = time.perf_counter_ns()
+            detect(path, content)
+            times[path].append(time.perf_counter_ns() - start)
+        passes.append(time.perf_counter_ns() - pass_start)
+
+    timings = {}
+    for path in samples:
+        timings[path] = statistics.median_low(times[path])
+        print("%d\t%s" % (timings[path], path))
+    print("wall\t%d\t%d" % (len(samples), statistics.median_low(passes)))
+
+    if args.profiles:
+        profile_slowest(timings, samples, args.profiles, args.slowest, args.profile_time)
+
+
+if __name__ == "__main__":
+    main()
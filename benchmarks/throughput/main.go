@@ -0,0 +1,184 @@
+// throughput runs the same corpus through the enry Go API or the enry CLI and
+// prints the median time spent on each file, as "<ns>\t<path>" lines, and the
+// median wall-clock time of a pass over the whole corpus, as a
+// "wall\t<files>\t<ns>" line, to be checked by the throughput gate of
+// benchmarks/parser.
+package main
+
+import (
+	"flag"
+	"fmt"
+	"io/ioutil"
+	"log"
+	"os"
+	"os/exec"
+	"path/filepath"
+	"runtime/pprof"
+	"sort"
+	"strings"
+	"time"
+
+	"github.com/go-enry/go-enry/v2"
+)
+
+type sample struct {
+	path    string
+	content []byte
+	times   []time.Duration
+	elapsed time.Duration
+}
+
+var (
+	// flags
+	mode        string
+	cliPath     string
+	iterations  int
+	profileDir  string
+	slowest     int
+	profileTime time.Duration
+)
+
+func main() {
+	flag.StringVar(&mode, "mode", "go", "what to run the corpus through: go (the library) or cli (the enry binary, once per file)")
+	flag.StringVar(&cliPath, "enry", "enry", "path to the enry binary, with -mode cli")
+	flag.IntVar(&iterations, "iterations", 5, "number of timed passes over the corpus, after a warm-up pass")
+	flag.StringVar(&profileDir, "profiles", "", "directory to leave CPU profiles of the slowest files in, with -mode go")
+	flag.IntVar(&slowest, "slowest", 10, "number of slowest files to profile")
+	flag.DurationVar(&profileTime, "profile-time", time.Second, "time spent detecting each profiled file")
+	flag.Parse()
+	if iterations < 1 {
+		log.Fatal("-iterations must be at least 1")
+	}
+
+	var samples []*sample
+	for _, dir := range flag.Args() {
+		s, err := getSamples(dir)
+		if err != nil {
+			log.Fatal(err)
+		}
+		samples = append(samples, s...)
+	}
+
+	var run func(*sample) error
+	switch mode {
+	case "go":
+		run = runGo
+	case "cli":
+		run = runCLI
+	default:
+		log.Fatalf("unknown mode %q", mode)
+	}
+
+	for _, s := range samples {
+		if err := run(s); err != nil {
+			log.Fatal(err)
+		}
+	}
+
+	passes := make([]time.Duration, 0, iterations)
+	for i := 0; i < iterations; i++ {
+		passStart := time.Now()
+		for _, s := range samples {
+			start := time.Now()
+			if err := run(s); err != nil {
+				log.Fatal(err)
+			}
+			s.times = append(s.times, time.Since(start))
+		}
+		passes = append(passes, time.Since(passStart))
+	}
+
+	for _, s := range samples {
+		s.elapsed = median(s.times)
+		fmt.Printf("%d\t%s\n", s.elapsed.Nanoseconds(), s.path)
+	}
+	fmt.Printf("wall\t%d\t%d\n", len(samples), median(passes).Nanoseconds())
+
+	if profileDir != "" && mode == "go" {
+		if err := profileSlowest(samples); err != nil {
+			log.Fatal(err)
+		}
+	}
+}
+
+func median(times []time.Duration) time.Duration {
+	sorted := append([]time.Duration(nil), times...)
+	sort.Slice(sorted, func(i, j int) bool { return sorted[i] < sorted[j] })
+	return sorted[(len(sorted)-1)/2]
+}
+
+func getSamples(dir string) ([]*sample, error) {
+	samples := make([]*sample, 0, 2000)
+	err := filepath.Walk(dir, func(path string, info os.FileInfo, err error) error {
+		if err != nil {
+			return err
+		}
+
+		if !info.Mode().IsRegular() {
+			return nil
+		}
+
+		content, err := ioutil.ReadFile(path)
+		if err != nil {
+			return err
+		}
+
+		samples = append(samples, &sample{path: path, content: content})
+		return nil
+	})
+	return samples, err
+}
+
+func runGo(s *sample) error {
+	enry.GetLanguage(filepath.Base(s.path), s.content)
+	return nil
+}
+
+func runCLI(s *sample) error {
+	out, err := exec.Command(cliPath, s.path).CombinedOutput()
+	if err != nil {
+		return fmt.Errorf("%s %s: %v: %s", cliPath, s.path, err, out)
+	}
+	return nil
+}
+
+// profileSlowest writes a CPU profile per slowest file, detecting it over and
+// over for profileTime. Profiles can be browsed as flame graphs with
+// go tool pprof -http=: <profile>.
+func profileSlowest(samples []*sample) error {
+	sorted := append([]*sample(nil), samples...)
+	sort.Slice(sorted, func(i, j int) bool { return sorted[i].elapsed > sorted[j].elapsed })
+	if len(sorted) > slowest {
+		sorted = sorted[:slowest]
+	}
+
+	if err := os.MkdirAll(profileDir, 0755); err != nil {
+		return err
+	}
+
+	for i, s := range sorted {
+		name := fmt.Sprintf("go-%02d-%s.pprof", i+1, strings.ReplaceAll(filepath.Base(s.path), " ", "_"))
+		if err := profile(s, filepath.Join(profileDir, name)); err != nil {
+			return err
+		}
+	}
+	return nil
+}
+
+func profile(s *sample, path string) error {
+	f, err := os.Create(path)
+	if err != nil {
+		return err
+	}
+	defer f.Close()
+
+	if err := pprof.StartCPUProfile(f); err != nil {
+		return err
+	}
+	defer pprof.StopCPUProfile()
+
+	for start := time.Now(); time.Since(start) < profileTime; {
+		runGo(s)
+	}
+	return nil
+}
@@ -19,6 +19,17 @@ type naiveBayes struct {
 	tokensTotal               float64
 }
 
+// earlyStoppingClassifier is a naiveBayes that stops scoring the content once
+// the most probable language is ahead of the others by margin.
+type earlyStoppingClassifier struct {
+	*naiveBayes
+	margin float64
+}
+
+func (c earlyStoppingClassifier) classify(content []byte, candidates map[string]float64) []string {
+	return c.classifyWithMargin(content, candidates, c.margin)
+}
+
 type scoredLanguage struct {
 	language string
 	score    float64
@@ -26,7 +37,54 @@ type scoredLanguage struct {
 
 // classify returns a sorted slice of possible languages sorted by decreasing language's probability
 func (c *naiveBayes) classify(content []byte, candidates map[string]float64) []string {
+	scoredLangs := c.scoredLanguages(candidates)
+	if len(content) != 0 {
+		c.score(scoredLangs, tokenizer.Tokenize(content))
+	}
+
+	return sortLanguagesByScore(scoredLangs)
+}
+
+// classifierPrefixBytes is the size of the first prefix of the content scored by classifyWithMargin.
+const classifierPrefixBytes = 4 << 10
+
+// classifyWithMargin is like classify, but scores growing prefixes of the
+// content: the first classifierPrefixBytes, then four times as many bytes, and
+// so on up to tokenizer.ByteLimit. It stops as soon as the best score of a
+// prefix exceeds the runner-up by more than margin, so that big files are
+// neither tokenized nor scored past their first few KB when those are decisive.
+// Each prefix is cut like tokenizer.ByteLimit cuts the content, and tokenizing
+// all of them costs at most about twice as much as tokenizing the content once.
+// A margin <= 0 scores all the tokens, like classify does.
+func (c *naiveBayes) classifyWithMargin(content []byte, candidates map[string]float64, margin float64) []string {
+	if margin <= 0 {
+		return c.classify(content, candidates)
+	}
+
+	scoredLangs := c.scoredLanguages(candidates)
+	if len(content) == 0 || len(scoredLangs) <= 1 {
+		return sortLanguagesByScore(scoredLangs)
+	}
+
+	if len(content) > tokenizer.ByteLimit {
+		content = content[:tokenizer.ByteLimit]
+	}
+
+	for prefix := classifierPrefixBytes; prefix < len(content); prefix *= 4 {
+		c.score(scoredLangs, tokenizer.Tokenize(content[:prefix]))
+		if scoreMargin(scoredLangs) > margin {
+			return sortLanguagesByScore(scoredLangs)
+		}
+
+		scoredLangs = c.scoredLanguages(candidates)
+	}
 
+	c.score(scoredLangs, tokenizer.Tokenize(content))
+	return sortLanguagesByScore(scoredLangs)
+}
+
+// scoredLanguages returns the candidates, or all known languages if there are none, scored by their prior probability.
+func (c *naiveBayes) scoredLanguages(candidates map[string]float64) []*scoredLanguage {
 	var languages map[string]float64
 	if len(candidates) == 0 {
 		languages = c.knownLangs()
@@ -41,26 +99,37 @@ func (c *naiveBayes) classify(content []byte, candidates map[string]float64) []s
 		}
 	}
 
-	empty := len(content) == 0
 	scoredLangs := make([]*scoredLanguage, 0, len(languages))
-
-	var tokens []string
-	if !empty {
-		tokens = tokenizer.Tokenize(content)
-	}
-
 	for language := range languages {
-		score := c.languagesLogProbabilities[language]
-		if !empty {
-			score += c.tokensLogProbability(tokens, language)
-		}
 		scoredLangs = append(scoredLangs, &scoredLanguage{
 			language: language,
-			score:    score,
+			score:    c.languagesLogProbabilities[language],
 		})
 	}
 
-	return sortLanguagesByScore(scoredLangs)
+	return scoredLangs
+}
+
+// score adds the probability of tokens to the score of each language.
+func (c *naiveBayes) score(scoredLangs []*scoredLanguage, tokens []string) {
+	for _, scoredLang := range scoredLangs {
+		scoredLang.score += c.tokensLogProbability(tokens, scoredLang.language)
+	}
+}
+
+// scoreMargin returns the difference between the two best scores.
+func scoreMargin(scoredLangs []*scoredLanguage) float64 {
+	first, second := math.Inf(-1), math.Inf(-1)
+	for _, scoredLang := range scoredLangs {
+		switch {
+		case scoredLang.score > first:
+			first, second = scoredLang.score, first
+		case scoredLang.score > second:
+			second = scoredLang.score
+		}
+	}
+
+	return first - second
 }
 
 func sortLanguagesByScore(scoredLangs []*scoredLanguage) []string {
@@ -0,0 +1,178 @@
+package enry
+
+import (
+	"container/list"
+	"encoding/binary"
+	"hash/maphash"
+	"math"
+	"path/filepath"
+	"strings"
+	"sync"
+
+	"github.com/go-enry/go-enry/v2/internal/tokenizer"
+)
+
+// ClassifierCacheStats reports the usage of the classifier cache.
+type ClassifierCacheStats struct {
+	Hits   uint64
+	Misses uint64
+	// Size is the number of results currently kept in the cache.
+	Size int
+}
+
+// HitRate returns the ratio of lookups that were served from the cache.
+func (s ClassifierCacheStats) HitRate() float64 {
+	total := s.Hits + s.Misses
+	if total == 0 {
+		return 0
+	}
+	return float64(s.Hits) / float64(total)
+}
+
+// classifierCache is the cache used by GetLanguagesByClassifier, nil if disabled.
+var (
+	classifierCacheMu sync.RWMutex
+	classifierCache   *lruCache
+)
+
+// EnableClassifierCache makes GetLanguagesByClassifier keep its results for
+// up to size distinct inputs, evicting the least recently used ones.
+//
+// A result is keyed by the file extension, the candidates, the margin of
+// GetLanguagesWithMargin and a fingerprint of the first prefixBytes bytes of
+// the content. As the classifier never looks past tokenizer.ByteLimit bytes,
+// a prefixBytes <= 0 or >= tokenizer.ByteLimit keeps results exact. A smaller
+// prefixBytes lets files sharing a common header skip the classifier, at the
+// cost of ignoring the rest of their content.
+//
+// Calling it again replaces the cache and resets its stats.
+func EnableClassifierCache(size, prefixBytes int) {
+	if prefixBytes <= 0 || prefixBytes > tokenizer.ByteLimit {
+		prefixBytes = tokenizer.ByteLimit
+	}
+
+	classifierCacheMu.Lock()
+	defer classifierCacheMu.Unlock()
+	classifierCache = newLRUCache(size, prefixBytes)
+}
+
+// DisableClassifierCache drops the classifier cache enabled by EnableClassifierCache.
+func DisableClassifierCache() {
+	classifierCacheMu.Lock()
+	defer classifierCacheMu.Unlock()
+	classifierCache = nil
+}
+
+// GetClassifierCacheStats returns the usage of the classifier cache.
+// The zero value is returned if the cache is disabled.
+func GetClassifierCacheStats() ClassifierCacheStats {
+	cache := getClassifierCache()
+	if cache == nil {
+		return ClassifierCacheStats{}
+	}
+	return cache.stats()
+}
+
+func getClassifierCache() *lruCache {
+	classifierCacheMu.RLock()
+	defer classifierCacheMu.RUnlock()
+	return classifierCache
+}
+
+var classifierCacheSeed = maphash.MakeSeed()
+
+// classifierCacheKey fingerprints the classifier input.
+func classifierCacheKey(filename string, content []byte, candidates []string, margin float64, prefixBytes int) uint64 {
+	var h maphash.Hash
+	h.SetSeed(classifierCacheSeed)
+
+	var marginBits [8]byte
+	binary.LittleEndian.PutUint64(marginBits[:], math.Float64bits(margin))
+	h.Write(marginBits[:])
+	h.WriteString(strings.ToLower(filepath.Ext(filename)))
+	for _, candidate := range candidates {
+		h.WriteByte(0)
+		h.WriteString(candidate)
+	}
+	h.WriteByte(0)
+
+	if len(content) > prefixBytes {
+		content = content[:prefixBytes]
+	}
+	h.Write(content)
+	return h.Sum64()
+}
+
+// lruCache is a fixed size, concurrency safe, least recently used cache of
+// classification results.
+type lruCache struct {
+	size        int
+	prefixBytes int
+
+	mu     sync.Mutex
+	items  map[uint64]*list.Element
+	order  *list.List
+	hits   uint64
+	misses uint64
+}
+
+type lruEntry struct {
+	key       uint64
+	languages []string
+}
+
+func newLRUCache(size, prefixBytes int) *lruCache {
+	if size < 1 {
+		size = 1
+	}
+	return &lruCache{
+		size:        size,
+		prefixBytes: prefixBytes,
+		items:       make(map[uint64]*list.Element, size),
+		order:       list.New(),
+	}
+}
+
+func (c *lruCache) get(key uint64) ([]string, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	elem, ok := c.items[key]
+	if !ok {
+		c.misses++
+		return nil, false
+	}
+
+	c.hits++
+	c.order.MoveToFront(elem)
+	return copyLanguages(elem.Value.(*lruEntry).languages), true
+}
+
+func (c *lruCache) add(key uint64, languages []string) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	if elem, ok := c.items[key]; ok {
+		c.order.MoveToFront(elem)
+		elem.Value.(*lruEntry).languages = copyLanguages(languages)
+		return
+	}
+
+	if c.order.Len() >= c.size {
+		oldest := c.order.Back()
+		c.order.Remove(oldest)
+		delete(c.items, oldest.Value.(*lruEntry).key)
+	}
+	c.items[key] = c.order.PushFront(&lruEntry{key, copyLanguages(languages)})
+}
+
+func (c *lruCache) stats() ClassifierCacheStats {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	return ClassifierCacheStats{Hits: c.hits, Misses: c.misses, Size: c.order.Len()}
+}
+
+// copyLanguages keeps the cached results safe from modifications by the callers.
+func copyLanguages(languages []string) []string {
+	return append([]string(nil), languages...)
+}
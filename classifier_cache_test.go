@@ -0,0 +1,53 @@
+package enry
+
+import (
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestClassifierCache(t *testing.T) {
+	EnableClassifierCache(2, 0)
+	defer DisableClassifierCache()
+
+	candidates := []string{"C", "C++", "Objective-C"}
+	header := []byte("#include <stdio.h>\nint main(void);\n")
+
+	want := GetLanguagesByClassifier("a.h", header, candidates)
+	require.NotEmpty(t, want)
+	assert.Equal(t, ClassifierCacheStats{Misses: 1, Size: 1}, GetClassifierCacheStats())
+
+	got := GetLanguagesByClassifier("b.h", header, candidates)
+	assert.Equal(t, want, got)
+	assert.Equal(t, ClassifierCacheStats{Hits: 1, Misses: 1, Size: 1}, GetClassifierCacheStats())
+
+	got[0] = "modified by the caller"
+	assert.Equal(t, want, GetLanguagesByClassifier("c.h", header, candidates))
+
+	// a different extension, candidates or content is a miss
+	GetLanguagesByClassifier("a.m", header, candidates)
+	GetLanguagesByClassifier("a.h", header, candidates[:2])
+	GetLanguagesByClassifier("a.h", []byte("@interface Foo\n@end\n"), candidates)
+	stats := GetClassifierCacheStats()
+	assert.Equal(t, uint64(2), stats.Hits)
+	assert.Equal(t, uint64(4), stats.Misses)
+	assert.Equal(t, 2, stats.Size, "least recently used results must be evicted")
+	assert.InDelta(t, 1.0/3, stats.HitRate(), 1e-9)
+
+	DisableClassifierCache()
+	assert.Equal(t, ClassifierCacheStats{}, GetClassifierCacheStats())
+	assert.Equal(t, want, GetLanguagesByClassifier("a.h", header, candidates))
+}
+
+func TestClassifierCachePrefix(t *testing.T) {
+	EnableClassifierCache(8, 16)
+	defer DisableClassifierCache()
+
+	candidates := []string{"Perl", "Prolog", "Raku"}
+	first := GetLanguagesByClassifier("a.pl", []byte("use strict;\nuse warnings;\nprint 1;\n"), candidates)
+	second := GetLanguagesByClassifier("b.pl", []byte("use strict;\nuse warnings;\n:- module(foo).\n"), candidates)
+
+	assert.Equal(t, first, second, "content sharing a prefix must be served from the cache")
+	assert.Equal(t, uint64(1), GetClassifierCacheStats().Hits)
+}
@@ -0,0 +1,41 @@
+package enry
+
+import (
+	"bytes"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+var testNaiveBayes = &naiveBayes{
+	languagesLogProbabilities: map[string]float64{"Alpha": -0.5, "Beta": -0.5},
+	tokensLogProbabilities: map[string]map[string]float64{
+		"Alpha": {"alpha": -1, "beta": -5},
+		"Beta":  {"alpha": -5, "beta": -1},
+	},
+	tokensTotal: 10,
+}
+
+func TestScoreMargin(t *testing.T) {
+	scoredLangs := []*scoredLanguage{{"A", -3}, {"B", -10}, {"C", -1}}
+	assert.Equal(t, 2.0, scoreMargin(scoredLangs))
+}
+
+func TestClassifyWithMargin(t *testing.T) {
+	// decisive first prefix followed by a tail that, fully scored, changes the outcome
+	content := append(bytes.Repeat([]byte("alpha\n"), classifierPrefixBytes/6), bytes.Repeat([]byte("beta beta\n"), classifierPrefixBytes/5)...)
+	candidates := map[string]float64{"Alpha": 1, "Beta": 1}
+
+	assert.Equal(t, []string{"Beta", "Alpha"}, testNaiveBayes.classify(content, candidates))
+	assert.Equal(t, []string{"Beta", "Alpha"}, testNaiveBayes.classifyWithMargin(content, candidates, 0))
+	assert.Equal(t, []string{"Alpha", "Beta"}, testNaiveBayes.classifyWithMargin(content, candidates, 100))
+}
+
+func TestClassifyWithMarginUndecidedPrefix(t *testing.T) {
+	// a first prefix that does not reach the margin is followed by a longer one
+	content := append(bytes.Repeat([]byte("alpha beta\n"), classifierPrefixBytes/11), bytes.Repeat([]byte("beta\n"), classifierPrefixBytes)...)
+	candidates := map[string]float64{"Alpha": 1, "Beta": 1}
+
+	assert.Equal(t, []string{"Beta", "Alpha"}, testNaiveBayes.classify(content, candidates))
+	assert.Equal(t, []string{"Beta", "Alpha"}, testNaiveBayes.classifyWithMargin(content, candidates, 100))
+}
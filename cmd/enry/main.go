@@ -32,6 +32,7 @@ func main() {
 	allLangs := flag.Bool("all", false, "Show all files, including those identified as non-programming languages")
 	countMode := flag.String("mode", "byte", "the method used to count file size. Available options are: file, line and byte")
 	limitKB := flag.Int64("limit", 16*1024, "Analyse first N KB of the file (-1 means no limit)")
+	margin := flag.Float64("margin", 0, "Stop classifying a file once the most probable language leads by this log-probability margin (0 means never)")
 	flag.Parse()
 	limit := (*limitKB) * 1024
 
@@ -51,7 +52,7 @@ func main() {
 	}
 
 	if fileInfo.Mode().IsRegular() {
-		err = printFileAnalysis(root, limit, *jsonFlag)
+		err = printFileAnalysis(root, limit, *margin, *jsonFlag)
 		if err != nil {
 			fmt.Println(err)
 		}
@@ -108,7 +109,7 @@ func main() {
 		}
 		// TODO(bzz): skip enry.IsGeneratedContent() as well, after https://github.com/src-d/enry/issues/213
 
-		language := enry.GetLanguage(filepath.Base(path), content)
+		language := enry.GetLanguageWithMargin(filepath.Base(path), content, *margin)
 		if language == enry.OtherLanguage {
 			return nil
 		}
@@ -151,7 +152,7 @@ func usage() {
 		os.Stderr,
 		`  %[1]s %[2]s build: %[3]s commit: %[4]s, based on linguist commit: %[5]s
   %[1]s, A simple (and faster) implementation of github/linguist
-  usage: %[1]s [-mode=(file|line|byte)] [-prog] <path>
+  usage: %[1]s [-mode=(file|line|byte)] [-prog] [-limit=KB] [-margin=N] <path>
          %[1]s [-mode=(file|line|byte)] [-prog] [-json] [-breakdown] <path>
          %[1]s [-mode=(file|line|byte)] [-prog] [-json] [-breakdown]
          %[1]s [-version]
@@ -261,7 +262,7 @@ func byteCountValues(root string, files []string) (float64, filelistError) {
 	return t, filesErr
 }
 
-func printFileAnalysis(file string, limit int64, isJSON bool) error {
+func printFileAnalysis(file string, limit int64, margin float64, isJSON bool) error {
 	data, err := readFile(file, limit)
 	if err != nil {
 		return err
@@ -279,7 +280,7 @@ func printFileAnalysis(file string, limit int64, isJSON bool) error {
 
 	// functions below can work on a sample
 	fileType := getFileType(file, data)
-	language := enry.GetLanguage(file, data)
+	language := enry.GetLanguageWithMargin(file, data, margin)
 	mimeType := enry.GetMIMEType(file, language)
 	vendored := enry.IsVendor(file)
 
@@ -19,24 +19,32 @@ const OtherLanguage = ""
 type Strategy func(filename string, content []byte, candidates []string) (languages []string)
 
 // DefaultStrategies is a sequence of strategies used by GetLanguage to detect languages.
-var DefaultStrategies = []Strategy{
-	GetLanguagesByModeline,
-	GetLanguagesByFilename,
-	GetLanguagesByShebang,
-	GetLanguagesByExtension,
-	GetLanguagesByXML,
-	GetLanguagesByManpage,
-	GetLanguagesByContent,
-	GetLanguagesByClassifier,
-}
-
-// defaultClassifier is a Naive Bayes classifier trained on Linguist samples.
-var defaultClassifier classifier = &naiveBayes{
+var DefaultStrategies = defaultStrategies(GetLanguagesByClassifier)
+
+// defaultStrategies returns the default sequence of strategies, ending with the given classifier strategy.
+func defaultStrategies(classifierStrategy Strategy) []Strategy {
+	return []Strategy{
+		GetLanguagesByModeline,
+		GetLanguagesByFilename,
+		GetLanguagesByShebang,
+		GetLanguagesByExtension,
+		GetLanguagesByXML,
+		GetLanguagesByManpage,
+		GetLanguagesByContent,
+		classifierStrategy,
+	}
+}
+
+// defaultNaiveBayes is a Naive Bayes classifier trained on Linguist samples.
+var defaultNaiveBayes = &naiveBayes{
 	languagesLogProbabilities: data.LanguagesLogProbabilities,
 	tokensLogProbabilities:    data.TokensLogProbabilities,
 	tokensTotal:               data.TokensTotal,
 }
 
+// defaultClassifier is the classifier used by GetLanguagesByClassifier.
+var defaultClassifier classifier = defaultNaiveBayes
+
 // GetLanguage applies a sequence of strategies based on the given filename and content
 // to find out the most probable language to return.
 func GetLanguage(filename string, content []byte) (language string) {
@@ -44,6 +52,13 @@ func GetLanguage(filename string, content []byte) (language string) {
 	return firstLanguage(languages)
 }
 
+// GetLanguageWithMargin is like GetLanguage, but it lets the classifier stop early on big files.
+// See GetLanguagesWithMargin.
+func GetLanguageWithMargin(filename string, content []byte, margin float64) (language string) {
+	languages := GetLanguagesWithMargin(filename, content, margin)
+	return firstLanguage(languages)
+}
+
 func firstLanguage(languages []string) string {
 	for _, l := range languages {
 		if l != "" {
@@ -123,12 +138,30 @@ func getFirstLanguageAndSafe(languages []string) (language string, safe bool) {
 // At least one of arguments should be set. If content is missing, language detection will be based on the filename.
 // The function won't read the file, given an empty content.
 func GetLanguages(filename string, content []byte) []string {
+	return getLanguages(filename, content, DefaultStrategies)
+}
+
+// GetLanguagesWithMargin is like GetLanguages, but its last strategy, instead of GetLanguagesByClassifier,
+// scores growing prefixes of the content, from its first 4KB up to the usual 100KB, and stops as soon as
+// the log-probability of the most probable language exceeds the one of the runner-up by more than margin.
+// It trades accuracy for speed on big files, where the first few KB are often decisive: those are
+// neither tokenized nor scored past the first decisive prefix.
+// It always applies the default sequence of strategies, even if DefaultStrategies was modified.
+// A margin <= 0 disables early stopping.
+func GetLanguagesWithMargin(filename string, content []byte, margin float64) []string {
+	if margin <= 0 {
+		return GetLanguages(filename, content)
+	}
+	return getLanguages(filename, content, defaultStrategies(classifierStrategyWithMargin(margin)))
+}
+
+func getLanguages(filename string, content []byte, strategies []Strategy) []string {
 	if IsBinary(content) {
 		return nil
 	}
 
 	var languages []string
-	for _, strategy := range DefaultStrategies {
+	for _, strategy := range strategies {
 		candidates := strategy(filename, content, languages)
 		// No candidates, continue to next strategy without updating languages
 		if len(candidates) == 0 {
@@ -402,7 +435,7 @@ func GetLanguagesByExtension(filename string, _ []byte, _ []string) []string {
 	dots := getDotIndexes(filename)
 	for _, dot := range dots {
 		ext := filename[dot:]
-		languages, ok := data.LanguagesByExtension[ext]
+		languages, ok := data.LookupLanguagesByExtension(ext)
 		if ok {
 			return languages
 		}
@@ -485,12 +518,41 @@ func GetLanguagesByContent(filename string, content []byte, _ []string) []string
 // GetLanguagesByClassifier returns a sorted slice of possible languages ordered by
 // decreasing language's probability. If there are not candidates it returns nil.
 // It is a Strategy that uses a pre-trained defaultClassifier.
+// Results are served from the classifier cache, if one is enabled by EnableClassifierCache.
 func GetLanguagesByClassifier(filename string, content []byte, candidates []string) (languages []string) {
+	return getLanguagesByClassifier(filename, content, candidates, 0)
+}
+
+// classifierStrategyWithMargin returns GetLanguagesByClassifier that stops early, see GetLanguagesWithMargin.
+func classifierStrategyWithMargin(margin float64) Strategy {
+	return func(filename string, content []byte, candidates []string) []string {
+		return getLanguagesByClassifier(filename, content, candidates, margin)
+	}
+}
+
+func getLanguagesByClassifier(filename string, content []byte, candidates []string, margin float64) []string {
 	if len(candidates) == 0 {
 		return nil
 	}
 
-	return getLanguagesBySpecificClassifier(content, candidates, defaultClassifier)
+	c := defaultClassifier
+	if margin > 0 {
+		c = earlyStoppingClassifier{defaultNaiveBayes, margin}
+	}
+
+	cache := getClassifierCache()
+	if cache == nil {
+		return getLanguagesBySpecificClassifier(content, candidates, c)
+	}
+
+	key := classifierCacheKey(filename, content, candidates, margin, cache.prefixBytes)
+	if languages, ok := cache.get(key); ok {
+		return languages
+	}
+
+	languages := getLanguagesBySpecificClassifier(content, candidates, c)
+	cache.add(key, languages)
+	return languages
 }
 
 // getLanguagesBySpecificClassifier returns a slice of possible languages. It takes in a Classifier to be used.
@@ -505,7 +567,7 @@ func getLanguagesBySpecificClassifier(content []byte, candidates []string, class
 
 // GetLanguageExtensions returns all extensions associated with the given language.
 func GetLanguageExtensions(language string) []string {
-	return data.ExtensionsByLanguage[language]
+	return data.LookupExtensionsByLanguage(language)
 }
 
 // GetLanguageType returns the type of the given language.
@@ -560,7 +622,7 @@ func GetLanguageInfo(language string) (data.LanguageInfo, error) {
 
 // GetLanguageInfoByID returns the LanguageInfo for a given language ID, or an error if not found.
 func GetLanguageInfoByID(id int) (data.LanguageInfo, error) {
-	if info, ok := data.LanguageInfoByID[id]; ok {
+	if info, ok := data.LookupLanguageInfoByID(id); ok {
 		return info, nil
 	}
 
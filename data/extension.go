@@ -2170,3 +2170,15 @@ var ExtensionsByLanguage = map[string][]string{
 	"wisp":                               {".wisp"},
 	"xBase":                              {".prg", ".ch", ".prw"},
 }
+
+// LookupLanguagesByExtension returns the languages associated with the given
+// lower-cased extension, including its leading dot.
+func LookupLanguagesByExtension(ext string) ([]string, bool) {
+	languages, ok := LanguagesByExtension[ext]
+	return languages, ok
+}
+
+// LookupExtensionsByLanguage returns all extensions associated with the given language.
+func LookupExtensionsByLanguage(language string) []string {
+	return ExtensionsByLanguage[language]
+}
@@ -17147,3 +17147,9 @@ var LanguageInfoByID = map[int]LanguageInfo{
 		LanguageID:     421,
 	},
 }
+
+// LookupLanguageInfoByID returns the LanguageInfo for the given language ID.
+func LookupLanguageInfoByID(id int) (LanguageInfo, bool) {
+	info, ok := LanguageInfoByID[id]
+	return info, ok
+}
@@ -125,9 +125,14 @@ func (r always) Match(data []byte) bool {
 }
 
 // Checks if a regex syntax isn't accepted by RE2 engine.
-// It's nil by construction from regex.MustCompileRuby but
+// It's nil by construction from regex.MustCompileRuby (or regex.MustCompileRubyLazy) but
 // is used here as a Matcher interface wich itself is non-nil.
 func runOnRE2AndRegexNotAccepted(re Matcher) bool {
-	v, ok := re.(regex.EnryRegexp)
-	return ok && v == nil
+	switch v := re.(type) {
+	case regex.EnryRegexp:
+		return v == nil
+	case *regex.LazyRegexp:
+		return v == nil
+	}
+	return false
 }
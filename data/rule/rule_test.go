@@ -30,11 +30,14 @@ var specificFixtures = map[string][]fixture{
 	regex.RE2: {
 		{"NilAnd", And(noLanguages(), regex.MustCompileRuby(`a`), regex.MustCompile(`b`)), 0, "b", "a"},
 		{"NilNot", Not(noLanguages(), regex.MustCompileRuby(`a`), regex.MustCompile(`b`)), 0, "c", "b"},
+		{"NilLazyAnd", And(noLanguages(), regex.MustCompileRubyLazy(`a`), regex.MustCompile(`b`)), 0, "b", "a"},
+		{"NilLazyOr", Or(noLanguages(), regex.MustCompileRubyLazy(`a`)), 0, "", "a"},
 	},
 	regex.Oniguruma: {
 		{"NilAnd", And(noLanguages(), regex.MustCompileRuby(`a`), regex.MustCompile(`b`)), 0, "ab", "c"},
 		{"NilNot", Not(noLanguages(), regex.MustCompileRuby(`a`), regex.MustCompile(`b`)), 0, "c", "a"},
 		{"NilOr", Or(noLanguages(), regex.MustCompileRuby(`a`) /*, regexp.MustCompile(`b`)*/), 0, "a", "b"},
+		{"NilLazyAnd", And(noLanguages(), regex.MustCompileRubyLazy(`a`), regex.MustCompile(`b`)), 0, "ab", "c"},
 	},
 }
 
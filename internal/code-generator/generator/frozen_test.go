@@ -0,0 +1,313 @@
+package generator
+
+import (
+	"fmt"
+	"io/ioutil"
+	"os"
+	"os/exec"
+	"path/filepath"
+	"strconv"
+	"strings"
+
+	"github.com/stretchr/testify/require"
+)
+
+// frozenLookupsHarness compares the lookups of the tables generated by the
+// default templates, in package "maps", to the ones generated by the frozen
+// templates, in package "frozen".
+const frozenLookupsHarness = `package main
+
+import (
+	"fmt"
+	"os"
+	"reflect"
+	"strings"
+
+	frozen "frozentest/frozen"
+	maps "frozentest/maps"
+)
+
+var failed bool
+
+func check(what string, key interface{}, want, got []interface{}) {
+	if !reflect.DeepEqual(want, got) {
+		fmt.Printf("%s(%v): maps %v, frozen %v\n", what, key, want, got)
+		failed = true
+	}
+}
+
+func main() {
+	for ext := range maps.LanguagesByExtension {
+		for _, e := range []string{ext, ext + "_", strings.TrimPrefix(ext, ".")} {
+			wl, wok := maps.LookupLanguagesByExtension(e)
+			gl, gok := frozen.LookupLanguagesByExtension(e)
+			check("LookupLanguagesByExtension", e, []interface{}{wl, wok}, []interface{}{gl, gok})
+		}
+	}
+
+	for lang := range maps.ExtensionsByLanguage {
+		for _, l := range []string{lang, lang + "_"} {
+			check("LookupExtensionsByLanguage", l, []interface{}{maps.LookupExtensionsByLanguage(l)}, []interface{}{frozen.LookupExtensionsByLanguage(l)})
+		}
+	}
+
+	for alias, lang := range maps.LanguageByAliasMap {
+		for _, a := range []string{alias, strings.ToUpper(alias), strings.Replace(alias, "_", " ", -1), lang, alias + "_"} {
+			wl, wok := maps.LanguageByAlias(a)
+			gl, gok := frozen.LanguageByAlias(a)
+			check("LanguageByAlias", a, []interface{}{wl, wok}, []interface{}{gl, gok})
+		}
+	}
+
+	for id := range maps.LanguageInfoByID {
+		for _, i := range []int{id, id + 1, -id} {
+			wi, wok := maps.LookupLanguageInfoByID(i)
+			gi, gok := frozen.LookupLanguageInfoByID(i)
+			// the LanguageInfo types of both packages differ, but not their Go syntax
+			check("LookupLanguageInfoByID", i, []interface{}{fmt.Sprintf("%#v", wi), wok}, []interface{}{fmt.Sprintf("%#v", gi), gok})
+		}
+	}
+
+	if failed || len(maps.LanguagesByExtension) == 0 || len(maps.LanguageInfoByID) == 0 {
+		os.Exit(1)
+	}
+}
+`
+
+// TestFrozenLookups checks that the binary searches of the frozen tables
+// return the same results as the maps of the default ones, by generating both
+// into a temporary module and running frozenLookupsHarness on them.
+func (s *GeneratorTestSuite) TestFrozenLookups() {
+	goBin, err := exec.LookPath("go")
+	if err != nil {
+		s.T().Skip("go command not found")
+	}
+
+	dir, err := ioutil.TempDir("", "generator-frozen-")
+	require.NoError(s.T(), err)
+	defer os.RemoveAll(dir)
+
+	languages := filepath.Join(s.tmpLinguistDir, languagesFile)
+	files := []struct {
+		pkg      string
+		generate File
+		out      string
+		tmplName string
+	}{
+		{"maps", Types, "type.go", typeTestTmplName},
+		{"maps", Extensions, "extension.go", extensionTestTmplName},
+		{"maps", Aliases, "alias.go", aliasTestTmplName},
+		{"maps", LanguageInfo, "languageInfo.go", "languageInfo.go.tmpl"},
+		{"frozen", Types, "type.go", typeTestTmplName},
+		{"frozen", Extensions, "extension.go", extensionFrozenTestTmplName},
+		{"frozen", Aliases, "alias.go", aliasFrozenTestTmplName},
+		{"frozen", LanguageInfo, "languageInfo.go", languageInfoFrozenTestTmplName},
+	}
+	for _, file := range files {
+		pkgDir := filepath.Join(dir, file.pkg)
+		require.NoError(s.T(), os.MkdirAll(pkgDir, 0755))
+
+		err := file.generate(languages, "", filepath.Join(pkgDir, file.out), filepath.Join(assetsDir, file.tmplName), file.tmplName, commit)
+		require.NoError(s.T(), err)
+	}
+
+	require.NoError(s.T(), ioutil.WriteFile(filepath.Join(dir, "go.mod"), []byte("module frozentest\n\ngo 1.14\n"), 0644))
+	require.NoError(s.T(), ioutil.WriteFile(filepath.Join(dir, "main.go"), []byte(frozenLookupsHarness), 0644))
+
+	cmd := exec.Command(goBin, "run", ".")
+	cmd.Dir = dir
+	out, err := cmd.CombinedOutput()
+	require.NoError(s.T(), err, "frozen lookups differ from the maps:\n%s", out)
+}
+
+// frozenHeuristicsHarness compares the rules of the heuristics generated by
+// the default template, in package "maps", to the ones generated by the frozen
+// template, in package "frozen", on the files of the directories given as
+// arguments. It then compiles every lazy regexp of the frozen rules, as their
+// patterns are no longer compiled, nor checked, at init time.
+const frozenHeuristicsHarness = `package main
+
+import (
+	"fmt"
+	"io/ioutil"
+	"os"
+	"path/filepath"
+	"reflect"
+	"strconv"
+	"unsafe"
+
+	"github.com/go-enry/go-enry/v2/regex"
+
+	frozen "frozentest/frozen"
+	maps "frozentest/maps"
+)
+
+var failed bool
+
+func readFiles(dirs []string) (map[string][][]byte, error) {
+	files := make(map[string][][]byte)
+	for _, dir := range dirs {
+		err := filepath.Walk(dir, func(path string, info os.FileInfo, err error) error {
+			if err != nil || info.IsDir() {
+				return err
+			}
+			content, err := ioutil.ReadFile(path)
+			if err != nil {
+				return err
+			}
+			files[filepath.Ext(path)] = append(files[filepath.Ext(path)], content)
+			files[""] = append(files[""], content)
+			return nil
+		})
+		if err != nil {
+			return nil, err
+		}
+	}
+	return files, nil
+}
+
+// compileLazy calls Regexp() on every non-nil *regex.LazyRegexp reachable
+// from v, including through unexported fields, and returns how many it found.
+func compileLazy(v reflect.Value) (n int) {
+	switch v.Kind() {
+	case reflect.Interface, reflect.Ptr:
+		if v.IsNil() {
+			return 0
+		}
+		if lazy, ok := v.Interface().(*regex.LazyRegexp); ok {
+			if lazy != nil {
+				lazy.Regexp()
+			}
+			return 1
+		}
+		return compileLazy(v.Elem())
+	case reflect.Map:
+		for _, key := range v.MapKeys() {
+			n += compileLazy(v.MapIndex(key))
+		}
+	case reflect.Slice:
+		for i := 0; i < v.Len(); i++ {
+			n += compileLazy(v.Index(i))
+		}
+	case reflect.Struct:
+		s := reflect.New(v.Type()).Elem()
+		s.Set(v)
+		for i := 0; i < s.NumField(); i++ {
+			field := s.Field(i)
+			n += compileLazy(reflect.NewAt(field.Type(), unsafe.Pointer(field.UnsafeAddr())).Elem())
+		}
+	}
+	return n
+}
+
+func main() {
+	lazies, _ := strconv.Atoi(os.Args[1])
+	files, err := readFiles(os.Args[2:])
+	if err != nil {
+		fmt.Println(err)
+		os.Exit(1)
+	}
+
+	for ext, want := range maps.ContentHeuristics {
+		got, ok := frozen.ContentHeuristics[ext]
+		if !ok || len(*got) != len(*want) {
+			fmt.Printf("ContentHeuristics[%q]: maps %d rules, frozen %v\n", ext, len(*want), got)
+			failed = true
+			continue
+		}
+		for i, rule := range *want {
+			if !reflect.DeepEqual(rule.Languages(), (*got)[i].Languages()) {
+				fmt.Printf("ContentHeuristics[%q][%d].Languages(): maps %v, frozen %v\n", ext, i, rule.Languages(), (*got)[i].Languages())
+				failed = true
+			}
+			// files with the extension, and every file if the extension has none
+			contents := files[ext]
+			if len(contents) == 0 {
+				contents = files[""]
+			}
+			for _, content := range contents {
+				if w, g := rule.Match(content), (*got)[i].Match(content); w != g {
+					fmt.Printf("ContentHeuristics[%q][%d].Match(%.40q): maps %v, frozen %v\n", ext, i, content, w, g)
+					failed = true
+				}
+			}
+		}
+	}
+	if len(frozen.ContentHeuristics) != len(maps.ContentHeuristics) {
+		fmt.Printf("ContentHeuristics: maps %d extensions, frozen %d\n", len(maps.ContentHeuristics), len(frozen.ContentHeuristics))
+		failed = true
+	}
+
+	if n := compileLazy(reflect.ValueOf(frozen.ContentHeuristics)); n != lazies {
+		fmt.Printf("compiled %d lazy regexps, generated %d\n", n, lazies)
+		failed = true
+	}
+
+	if failed || len(maps.ContentHeuristics) == 0 || len(files[""]) == 0 {
+		os.Exit(1)
+	}
+}
+`
+
+// frozenHeuristicsTypes is the part of package data that the generated
+// heuristics need.
+const frozenHeuristicsTypes = `package data
+
+import "github.com/go-enry/go-enry/v2/data/rule"
+
+type Heuristics []rule.Heuristic
+`
+
+// TestFrozenHeuristics checks that the heuristics generated by the frozen
+// template match the same files as the default ones, and that all their lazy
+// regexps compile, by generating both into a temporary module that depends on
+// this one and running frozenHeuristicsHarness on the linguist samples and
+// the files of _testdata.
+func (s *GeneratorTestSuite) TestFrozenHeuristics() {
+	goBin, err := exec.LookPath("go")
+	if err != nil {
+		s.T().Skip("go command not found")
+	}
+
+	root, err := filepath.Abs(filepath.Join("..", "..", ".."))
+	require.NoError(s.T(), err)
+	dir, err := ioutil.TempDir("", "generator-frozen-")
+	require.NoError(s.T(), err)
+	defer os.RemoveAll(dir)
+
+	heuristics := filepath.Join(s.tmpLinguistDir, heuristicsTestFile)
+	files := []struct {
+		pkg      string
+		tmplName string
+	}{
+		{"maps", contentTestTmplName},
+		{"frozen", contentFrozenTestTmplName},
+	}
+	for _, file := range files {
+		pkgDir := filepath.Join(dir, file.pkg)
+		require.NoError(s.T(), os.MkdirAll(pkgDir, 0755))
+		require.NoError(s.T(), ioutil.WriteFile(filepath.Join(pkgDir, "heuristics.go"), []byte(frozenHeuristicsTypes), 0644))
+
+		err := GenHeuristics(heuristics, "", filepath.Join(pkgDir, "content.go"), filepath.Join(assetsDir, file.tmplName), file.tmplName, commit)
+		require.NoError(s.T(), err)
+	}
+	frozen, err := ioutil.ReadFile(filepath.Join(dir, "frozen", "content.go"))
+	require.NoError(s.T(), err)
+
+	// the temporary module resolves the dependencies of this one like it does
+	goMod, err := ioutil.ReadFile(filepath.Join(root, "go.mod"))
+	require.NoError(s.T(), err)
+	goMod = []byte(strings.Replace(string(goMod), "module github.com/go-enry/go-enry/v2", "module frozentest", 1) +
+		fmt.Sprintf("\nrequire github.com/go-enry/go-enry/v2 v2.0.0\n\nreplace github.com/go-enry/go-enry/v2 => %s\n", root))
+	require.NoError(s.T(), ioutil.WriteFile(filepath.Join(dir, "go.mod"), goMod, 0644))
+	if goSum, err := ioutil.ReadFile(filepath.Join(root, "go.sum")); err == nil {
+		require.NoError(s.T(), ioutil.WriteFile(filepath.Join(dir, "go.sum"), goSum, 0644))
+	}
+	require.NoError(s.T(), ioutil.WriteFile(filepath.Join(dir, "main.go"), []byte(frozenHeuristicsHarness), 0644))
+
+	lazies := strconv.Itoa(strings.Count(string(frozen), "Lazy("))
+	cmd := exec.Command(goBin, "run", ".", lazies, filepath.Join(s.tmpLinguistDir, samplesDir), filepath.Join(root, "_testdata"))
+	cmd.Dir = dir
+	out, err := cmd.CombinedOutput()
+	require.NoError(s.T(), err, "frozen heuristics differ from the default ones:\n%s", out)
+}
@@ -33,12 +33,20 @@ var (
 	extensionTestTmplPath = filepath.Join(assetsDir, "extension.go.tmpl")
 	extensionTestTmplName = "extension.go.tmpl"
 
+	extensionFrozenGold         = filepath.Join(testDir, "extension.frozen.gold")
+	extensionFrozenTestTmplPath = filepath.Join(assetsDir, "extension.frozen.go.tmpl")
+	extensionFrozenTestTmplName = "extension.frozen.go.tmpl"
+
 	// Heuristics test
 	heuristicsTestFile  = filepath.Join("lib", "linguist", "heuristics.yml")
 	contentGold         = filepath.Join(testDir, "content.gold")
 	contentTestTmplPath = filepath.Join(assetsDir, "content.go.tmpl")
 	contentTestTmplName = "content.go.tmpl"
 
+	contentFrozenGold         = filepath.Join(testDir, "content.frozen.gold")
+	contentFrozenTestTmplPath = filepath.Join(assetsDir, "content.frozen.go.tmpl")
+	contentFrozenTestTmplName = "content.frozen.go.tmpl"
+
 	// Vendor test
 	vendorTestFile     = filepath.Join("lib", "linguist", "vendor.yml")
 	vendorGold         = filepath.Join(testDir, "vendor.gold")
@@ -71,6 +79,15 @@ var (
 	aliasTestTmplPath = filepath.Join(assetsDir, "alias.go.tmpl")
 	aliasTestTmplName = "alias.go.tmpl"
 
+	aliasFrozenGold         = filepath.Join(testDir, "alias.frozen.gold")
+	aliasFrozenTestTmplPath = filepath.Join(assetsDir, "alias.frozen.go.tmpl")
+	aliasFrozenTestTmplName = "alias.frozen.go.tmpl"
+
+	// LanguageInfo test
+	languageInfoFrozenGold         = filepath.Join(testDir, "languageInfo.frozen.gold")
+	languageInfoFrozenTestTmplPath = filepath.Join(assetsDir, "languageInfo.frozen.go.tmpl")
+	languageInfoFrozenTestTmplName = "languageInfo.frozen.go.tmpl"
+
 	// Frequencies test
 	frequenciesGold         = filepath.Join(testDir, "frequencies.gold")
 	frequenciesTestTmplPath = filepath.Join(assetsDir, "frequencies.go.tmpl")
@@ -137,6 +154,16 @@ func (s *GeneratorTestSuite) SetupSuite() {
 			generate:    Extensions,
 			wantOut:     extensionGold,
 		},
+		{
+			name:        "Extensions() frozen",
+			fileToParse: filepath.Join(s.tmpLinguistDir, languagesFile),
+			samplesDir:  "",
+			tmplPath:    extensionFrozenTestTmplPath,
+			tmplName:    extensionFrozenTestTmplName,
+			commit:      commit,
+			generate:    Extensions,
+			wantOut:     extensionFrozenGold,
+		},
 		{
 			name:        "Heuristics()",
 			fileToParse: filepath.Join(s.tmpLinguistDir, heuristicsTestFile),
@@ -147,6 +174,16 @@ func (s *GeneratorTestSuite) SetupSuite() {
 			generate:    GenHeuristics,
 			wantOut:     contentGold,
 		},
+		{
+			name:        "Heuristics() frozen",
+			fileToParse: filepath.Join(s.tmpLinguistDir, heuristicsTestFile),
+			samplesDir:  "",
+			tmplPath:    contentFrozenTestTmplPath,
+			tmplName:    contentFrozenTestTmplName,
+			commit:      commit,
+			generate:    GenHeuristics,
+			wantOut:     contentFrozenGold,
+		},
 		{
 			name:        "Vendor()",
 			fileToParse: filepath.Join(s.tmpLinguistDir, vendorTestFile),
@@ -207,6 +244,26 @@ func (s *GeneratorTestSuite) SetupSuite() {
 			generate:    Aliases,
 			wantOut:     aliasGold,
 		},
+		{
+			name:        "Aliases() frozen",
+			fileToParse: filepath.Join(s.tmpLinguistDir, languagesFile),
+			samplesDir:  "",
+			tmplPath:    aliasFrozenTestTmplPath,
+			tmplName:    aliasFrozenTestTmplName,
+			commit:      commit,
+			generate:    Aliases,
+			wantOut:     aliasFrozenGold,
+		},
+		{
+			name:        "LanguageInfo() frozen",
+			fileToParse: filepath.Join(s.tmpLinguistDir, languagesFile),
+			samplesDir:  "",
+			tmplPath:    languageInfoFrozenTestTmplPath,
+			tmplName:    languageInfoFrozenTestTmplName,
+			commit:      commit,
+			generate:    LanguageInfo,
+			wantOut:     languageInfoFrozenGold,
+		},
 		{
 			name:       "Frequencies()",
 			samplesDir: filepath.Join(s.tmpLinguistDir, samplesDir),
@@ -5,6 +5,7 @@ import (
 	"io"
 	"io/ioutil"
 	"sort"
+	"text/template"
 
 	"gopkg.in/yaml.v2"
 )
@@ -57,6 +58,32 @@ func LanguageInfo(fileToParse, samplesDir, outPath, tmplPath, tmplName, commit s
 	return formatedWrite(outPath, buf.Bytes())
 }
 
+// namedLanguageInfo is a languageInfo along with the name of its language.
+type namedLanguageInfo struct {
+	Name string
+	*languageInfo
+}
+
+// getOrderedByID returns languages sorted by their Linguist-assigned IDs.
+func getOrderedByID(languages map[string]*languageInfo) []namedLanguageInfo {
+	list := make([]namedLanguageInfo, 0, len(languages))
+	for lang, info := range languages {
+		if info.LanguageID == nil {
+			continue
+		}
+		list = append(list, namedLanguageInfo{lang, info})
+	}
+
+	sort.Slice(list, func(i, j int) bool {
+		return *list[i].LanguageID < *list[j].LanguageID
+	})
+	return list
+}
+
 func executeLanguageInfoTemplate(out io.Writer, languages map[string]*languageInfo, tmplPath, tmplName, commit string) error {
-	return executeTemplate(out, tmplName, tmplPath, commit, nil, languages)
+	fmap := template.FuncMap{
+		"orderedByID": getOrderedByID,
+		"typeConst":   func(t string) int { return typeToTypeConst[t] },
+	}
+	return executeTemplate(out, tmplName, tmplPath, commit, fmap, languages)
 }
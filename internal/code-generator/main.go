@@ -1,6 +1,7 @@
 package main
 
 import (
+	"flag"
 	"io/ioutil"
 	"log"
 	"path/filepath"
@@ -96,8 +97,20 @@ var (
 	langaugeInfoTmpl     = "languageInfo.go.tmpl"
 
 	commitPath = filepath.Join(".linguist", ".git", "HEAD")
+
+	// frozen generation replaces maps and eagerly compiled regexps of the
+	// largest tables with sorted arrays and lazily compiled regexps
+	frozen = flag.Bool("frozen", false, "generate frozen sorted-array tables and lazy regexps")
 )
 
+// frozenTmpls maps the templates with a frozen variant to it.
+var frozenTmpls = map[string]string{
+	extensionsTmpl:   "extension.frozen.go.tmpl",
+	contentTmpl:      "content.frozen.go.tmpl",
+	aliasesTmpl:      "alias.frozen.go.tmpl",
+	langaugeInfoTmpl: "languageInfo.frozen.go.tmpl",
+}
+
 type generatorFiles struct {
 	generate    generator.File
 	fileToParse string
@@ -109,6 +122,8 @@ type generatorFiles struct {
 }
 
 func main() {
+	flag.Parse()
+
 	commit, err := getCommit(commitPath)
 	if err != nil {
 		log.Printf("couldn't find commit: %v", err)
@@ -133,6 +148,10 @@ func main() {
 	}
 
 	for _, file := range fileList {
+		if tmplName, ok := frozenTmpls[file.tmplName]; ok && *frozen {
+			file.tmplName = tmplName
+			file.tmplPath = filepath.Join(assetsDir, tmplName)
+		}
 		if err := file.generate(file.fileToParse, file.samplesDir, file.outPath, file.tmplPath, file.tmplName, file.commit); err != nil {
 			log.Fatalf("failed to generate %q from %q - %+v", file.outPath, file.tmplPath, err)
 		}
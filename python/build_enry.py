@@ -12,6 +12,7 @@ ffibuilder.cdef(
 typedef unsigned char GoUint8;
 typedef long long GoInt64;
 typedef GoInt64 GoInt;
+typedef double GoFloat64;
 
 typedef struct { const char *p; ptrdiff_t n; } _GoString_;
 typedef _GoString_ GoString;
@@ -21,6 +22,8 @@ typedef struct { void *data; GoInt len; GoInt cap; } GoSlice;
 
 extern GoString GetLanguage(GoString p0, GoSlice p1);
 
+extern GoString GetLanguageWithMargin(GoString p0, GoSlice p1, GoFloat64 p2);
+
 /* Return type for GetLanguageByContent */
 struct GetLanguageByContent_return {
     GoString r0; /* language */
@@ -81,6 +84,8 @@ extern void GetLanguageExtensions(GoString p0, GoSlice* p1);
 
 extern void GetLanguages(GoString p0, GoSlice p1, GoSlice* p2);
 
+extern void GetLanguagesWithMargin(GoString p0, GoSlice p1, GoFloat64 p2, GoSlice* p3);
+
 extern void GetLanguagesByContent(GoString p0, GoSlice p1, GoSlice p2, GoSlice* p3);
 
 extern void GetLanguagesByEmacsModeline(GoString p0, GoSlice p1, GoSlice p2, GoSlice* p3);
@@ -112,6 +117,19 @@ extern GoUint8 IsVendor(GoString p0);
 extern GoUint8 IsGenerated(GoString p0, GoSlice p1);
 
 extern GoString GetColor(GoString p0);
+
+extern void EnableClassifierCache(GoInt p0, GoInt p1);
+
+extern void DisableClassifierCache();
+
+/* Return type for GetClassifierCacheStats */
+struct GetClassifierCacheStats_return {
+    GoInt r0; /* hits */
+    GoInt r1; /* misses */
+    GoInt r2; /* size */
+};
+
+extern struct GetClassifierCacheStats_return GetClassifierCacheStats();
 """
 )
 
@@ -1,9 +1,23 @@
-from enry.definitions import get_color, get_language, get_language_by_content, get_language_by_emacs_modeline, \
-    get_language_by_extension, get_language_by_filename, get_language_by_modeline, get_language_by_shebang, \
-    get_language_by_vim_modeline, get_languages, get_mime_type, is_binary, is_configuration, is_documentation, \
-    is_dot_file, is_generated, is_image, is_vendor, get_language_extensions
+"""
+Python bindings for enry.
+
+The bindings are loaded on the first access to any of the functions below,
+so that importing enry (e.g. enry.server, in the master process of a prefork
+server) does not start the Go runtime before fork.
+"""
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from enry.definitions import disable_classifier_cache, enable_classifier_cache, get_classifier_cache_stats, \
+        get_color, get_language, get_language_by_content, get_language_by_emacs_modeline, get_language_by_extension, \
+        get_language_by_filename, get_language_by_modeline, get_language_by_shebang, get_language_by_vim_modeline, \
+        get_languages, get_mime_type, is_binary, is_configuration, is_documentation, is_dot_file, is_generated, \
+        is_image, is_vendor, get_language_extensions
 
 __all__ = [
+    "disable_classifier_cache",
+    "enable_classifier_cache",
+    "get_classifier_cache_stats",
     "get_color",
     "get_language",
     "get_language_extensions",
@@ -24,3 +38,10 @@ __all__ = [
     "is_dot_file",
     "is_configuration",
 ]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        from enry import definitions
+        return getattr(definitions, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,14 @@
 """
 Python library calling enry Go implementation trough cFFI (API, out-of-line) and Cgo.
 """
-from typing import List
+from typing import List, Optional
 
 from _c_enry import lib
-from enry.types import Guess
+from enry.types import ClassifierCacheStats, Guess
 from enry.utils import transform_types, transform_types_ret_str_slice
 
 GetLanguage = transform_types([str, bytes], str)(lib.GetLanguage)
+GetLanguageWithMargin = transform_types([str, bytes, float], str)(lib.GetLanguageWithMargin)
 GetLanguageByContent = transform_types([str, bytes], Guess)(lib.GetLanguageByContent)
 GetLanguageByExtension = transform_types([str], Guess)(lib.GetLanguageByExtension)
 GetLanguageByFilename = transform_types([str], Guess)(lib.GetLanguageByFilename)
@@ -17,6 +18,7 @@ GetLanguageByEmacsModeline = transform_types([bytes], Guess)(lib.GetLanguageByEm
 GetLanguageByVimModeline = transform_types([bytes], Guess)(lib.GetLanguageByVimModeline)
 
 GetLanguages = transform_types_ret_str_slice([str, bytes])(lib.GetLanguages)
+GetLanguagesWithMargin = transform_types_ret_str_slice([str, bytes, float])(lib.GetLanguagesWithMargin)
 GetLanguageExtensions = transform_types_ret_str_slice([str])(lib.GetLanguageExtensions)
 
 GetMimeType = transform_types([str, str], str)(lib.GetMimeType)
@@ -30,16 +32,22 @@ IsDocumentation = transform_types([str], bool)(lib.IsDocumentation)
 IsDotFile = transform_types([str], bool)(lib.IsDotFile)
 IsImage = transform_types([str], bool)(lib.IsImage)
 
+GetClassifierCacheStats = transform_types([], ClassifierCacheStats)(lib.GetClassifierCacheStats)
 
-def get_language(filename: str, content: bytes) -> str:
+
+def get_language(filename: str, content: bytes, max_confidence_margin: Optional[float] = None) -> str:
     """
     Return the language of the given file based on the filename and its contents.
 
     :param filename: name of the file with the extension
     :param content: array of bytes with the contents of the file (the code)
+    :param max_confidence_margin: if set, the classifier scores growing prefixes of the content and
+        stops once the log-probability of the best language exceeds the runner-up's by this margin
     :return: the guessed language
     """
-    return GetLanguage(filename, content)
+    if max_confidence_margin is None:
+        return GetLanguage(filename, content)
+    return GetLanguageWithMargin(filename, content, float(max_confidence_margin))
 
 
 def get_language_by_content(filename: str, content: bytes) -> Guess:
@@ -127,15 +135,18 @@ def get_language_by_shebang(content: bytes) -> Guess:
     return GetLanguageByShebang(content)
 
 
-def get_languages(filename: str, content: bytes) -> List[str]:
+def get_languages(filename: str, content: bytes, max_confidence_margin: Optional[float] = None) -> List[str]:
     """
     Return all possible languages for the given file.
 
     :param filename:
     :param content: array of bytes with the contents of the file (the code)
+    :param max_confidence_margin: see get_language
     :return: all possible languages
     """
-    return GetLanguages(filename, content)
+    if max_confidence_margin is None:
+        return GetLanguages(filename, content)
+    return GetLanguagesWithMargin(filename, content, float(max_confidence_margin))
 
 
 def get_language_extensions(language: str) -> List[str]:
@@ -238,3 +249,35 @@ def is_image(path: str) -> bool:
     :return: whether it's an image or not
     """
     return IsImage(path)
+
+
+def enable_classifier_cache(size: int = 1024, prefix_bytes: int = 0) -> None:
+    """
+    Keep the results of the Bayesian classifier for up to `size` distinct
+    inputs, evicting the least recently used ones.
+
+    Results are keyed by the file extension, the candidate languages and
+    the first `prefix_bytes` bytes of the content. With the default of 0 the
+    whole content seen by the classifier is used and results stay exact; a
+    smaller prefix lets files sharing a header skip the classifier.
+
+    :param size: maximum number of cached results
+    :param prefix_bytes: number of leading content bytes to fingerprint
+    """
+    lib.EnableClassifierCache(size, prefix_bytes)
+
+
+def disable_classifier_cache() -> None:
+    """
+    Drop the classifier cache enabled by enable_classifier_cache.
+    """
+    lib.DisableClassifierCache()
+
+
+def get_classifier_cache_stats() -> ClassifierCacheStats:
+    """
+    Return hits, misses and size of the classifier cache.
+
+    :return: cache stats, all zeros if the cache is disabled
+    """
+    return GetClassifierCacheStats()
@@ -0,0 +1,427 @@
+"""
+Fork-safe pool of long-lived enry worker processes, serving language detection
+over a local Unix socket.
+
+Loading the Go runtime (through _c_enry) before fork() is unsafe, and loading it
+after fork() in every worker of a prefork server multiplies startup time and
+memory. A Server started in the master process spawns fresh interpreters, that
+are the only ones to load the library, and forked workers talk to them through
+a Client:
+
+    server = Server("/tmp/enry.sock", workers=4)  # in the master, before fork
+    ...
+    client = Client("/tmp/enry.sock")  # in each forked worker
+    client.get_language("foo.h", content)
+
+Requests on a connection are pipelined and answered in order. Each request is
+a REQUEST_HEADER (request id, op, confidence margin, filename and content
+lengths) followed by the filename and the content; each response is a
+RESPONSE_HEADER (request id, status, payload length) followed by the payload,
+which is the NUL-separated list of languages or an error message.
+"""
+import collections
+import os
+import socket
+import stat
+import struct
+import subprocess
+import sys
+import threading
+import time
+import weakref
+from typing import BinaryIO, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+OP_GET_LANGUAGES = 1
+OP_STATS = 2
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+REQUEST_HEADER = struct.Struct("!IBdHI")
+RESPONSE_HEADER = struct.Struct("!IBI")
+
+
+class ServerError(RuntimeError):
+    pass
+
+
+class LatencyHistogram:
+    """
+    Histogram of request latencies. Bucket 0 counts latencies under 1µs and
+    bucket i > 0 the ones in [2^(i-1), 2^i) µs.
+    """
+
+    BUCKETS = 32
+    _packer = struct.Struct(f"!{BUCKETS}Q")
+
+    def __init__(self, counts: Optional[Iterable[int]] = None):
+        self.counts = list(counts) if counts is not None else [0] * self.BUCKETS
+
+    def record(self, seconds: float) -> None:
+        bucket = int(seconds * 1e6).bit_length()
+        self.counts[min(bucket, self.BUCKETS - 1)] += 1
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def percentile(self, p: float) -> float:
+        """
+        Return an upper bound of the p-th percentile of latencies.
+
+        :param p: percentile, between 0 and 100
+        :return: latency in seconds
+        """
+        rank = p / 100 * self.count
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return (1 << bucket) / 1e6
+        return 0.0
+
+    def pack(self) -> bytes:
+        return self._packer.pack(*self.counts)
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "LatencyHistogram":
+        return cls(cls._packer.unpack(data))
+
+
+class WorkerStats(NamedTuple):
+    pid: int
+    latency: LatencyHistogram
+
+
+def _read_exact(stream: BinaryIO, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise EOFError("connection closed in the middle of a message")
+    return data
+
+
+def _read_request(stream: BinaryIO) -> Optional[Tuple[int, int, float, bytes, bytes]]:
+    header = stream.read(REQUEST_HEADER.size)
+    if not header:
+        return None
+    if len(header) != REQUEST_HEADER.size:
+        raise EOFError("connection closed in the middle of a message")
+
+    request_id, op, margin, filename_len, content_len = REQUEST_HEADER.unpack(header)
+    filename = _read_exact(stream, filename_len)
+    content = _read_exact(stream, content_len)
+    return request_id, op, margin, filename, content
+
+
+def _pack_request(request_id: int, op: int, margin: float, filename: str, content: bytes) -> bytes:
+    # file names from os functions may hold undecodable bytes as surrogates
+    filename_bytes = filename.encode("utf-8", "surrogateescape")
+    header = REQUEST_HEADER.pack(request_id, op, margin, len(filename_bytes), len(content))
+    return b"".join((header, filename_bytes, content))
+
+
+def _read_response(stream: BinaryIO) -> Tuple[int, int, bytes]:
+    request_id, status, payload_len = RESPONSE_HEADER.unpack(_read_exact(stream, RESPONSE_HEADER.size))
+    return request_id, status, _read_exact(stream, payload_len)
+
+
+def _write_response(stream: BinaryIO, request_id: int, status: int, payload: bytes) -> None:
+    stream.write(RESPONSE_HEADER.pack(request_id, status, len(payload)))
+    stream.write(payload)
+    stream.flush()
+
+
+def _worker_env() -> dict:
+    # spawned interpreters must find enry the same way this one does
+    path = [entry or os.getcwd() for entry in sys.path]
+    return dict(os.environ, PYTHONPATH=os.pathsep.join(path))
+
+
+# servers started by this process, see _forget_servers_in_child
+_servers = weakref.WeakSet()
+
+
+class Server:
+    """
+    Pool of worker processes accepting connections on a Unix socket.
+
+    Processes forked after the Server is started do not own it: they can not
+    query its stats, and closing it in them does not stop the workers.
+
+    :param path: path of the Unix socket to listen on, replaced if it is a stale socket
+    :param workers: number of worker processes
+    """
+
+    def __init__(self, path: str, workers: int = os.cpu_count() or 1):
+        self.path = path
+        self._owner_pid = os.getpid()
+        self._control_lock = threading.Lock()
+        self._workers = []
+        self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            # a master that was killed leaves its socket behind
+            if stat.S_ISSOCK(os.stat(path).st_mode):
+                os.unlink(path)
+        except FileNotFoundError:
+            pass
+        self._listener.bind(path)
+        self._listener.listen(128)
+
+        fd = self._listener.fileno()
+        _servers.add(self)
+        try:
+            for _ in range(workers):
+                self._workers.append(subprocess.Popen(
+                    [sys.executable, "-m", "enry.server", str(fd)],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    pass_fds=(fd,),
+                    env=_worker_env(),
+                ))
+            for worker in self._workers:
+                # every worker reports once it has loaded the library
+                try:
+                    _read_response(worker.stdout)
+                except EOFError:
+                    raise ServerError(f"enry worker {worker.pid} failed to start") from None
+        except BaseException:
+            self.close()
+            raise
+
+    def stats(self) -> List[WorkerStats]:
+        """
+        Return the latency histogram of each worker.
+
+        :return: stats of all workers
+        """
+        stats = []
+        with self._control_lock:
+            for worker in self._workers:
+                worker.stdin.write(_pack_request(0, OP_STATS, 0.0, "", b""))
+                worker.stdin.flush()
+                _, _, payload = _read_response(worker.stdout)
+                stats.append(WorkerStats(worker.pid, LatencyHistogram.unpack(payload)))
+        return stats
+
+    def close(self) -> None:
+        """
+        Stop the workers and remove the socket.
+        """
+        for worker in self._workers:
+            # workers exit once their control pipe is closed
+            worker.stdin.close()
+        for worker in self._workers:
+            try:
+                worker.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                worker.kill()
+                worker.wait()
+            worker.stdout.close()
+        self._workers = []
+
+        self._listener.close()
+        if os.getpid() == self._owner_pid and os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def _forget(self) -> None:
+        # a forked child must not keep the control pipes open: workers only
+        # exit once all the write ends of their stdin are closed
+        for worker in self._workers:
+            worker.stdin.close()
+            worker.stdout.close()
+        self._workers = []
+        self._listener.close()
+
+    def __enter__(self) -> "Server":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class Client:
+    """
+    Connection to a Server. A Client must not be shared between processes.
+
+    :param path: path of the Unix socket of the server
+    :param window: maximum number of requests in flight, when pipelining
+    """
+
+    def __init__(self, path: str, window: int = 64):
+        self.window = window
+        self._next_id = 0
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.connect(path)
+        self._rfile = self._sock.makefile("rb")
+
+    def get_language(self, filename: str, content: bytes, max_confidence_margin: Optional[float] = None) -> str:
+        """
+        Return the language of the given file, see enry.get_language.
+
+        :param filename: name of the file with the extension
+        :param content: array of bytes with the contents of the file (the code)
+        :param max_confidence_margin: see enry.get_language
+        :return: the guessed language
+        """
+        languages = self.get_languages(filename, content, max_confidence_margin)
+        return next((language for language in languages if language), "")
+
+    def get_languages(self, filename: str, content: bytes,
+                      max_confidence_margin: Optional[float] = None) -> List[str]:
+        """
+        Return all possible languages for the given file, see enry.get_languages.
+
+        :param filename: name of the file with the extension
+        :param content: array of bytes with the contents of the file (the code)
+        :param max_confidence_margin: see enry.get_language
+        :return: all possible languages
+        """
+        result = self.get_languages_batch([(filename, content)], max_confidence_margin)[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def get_languages_batch(self, files: Iterable[Tuple[str, bytes]],
+                            max_confidence_margin: Optional[float] = None) -> List[Union[List[str], Exception]]:
+        """
+        Return all possible languages for each of the given files, pipelining
+        up to `window` requests. A file that fails does not fail the batch: its
+        entry is the exception instead, a ServerError if the server failed to
+        process it, or the UnicodeEncodeError or struct.error that kept it from
+        being sent.
+
+        :param files: pairs of filename and content
+        :param max_confidence_margin: see enry.get_language
+        :return: all possible languages, or the error, in the order of files
+        """
+        margin = float(max_confidence_margin or 0)
+        results = []
+        in_flight = collections.deque()
+        try:
+            for filename, content in files:
+                if len(in_flight) >= self.window:
+                    self._receive(*in_flight.popleft(), results)
+                index = len(results)
+                results.append(None)
+                request_id = self._next_id
+                try:
+                    request = _pack_request(request_id, OP_GET_LANGUAGES, margin, filename, content)
+                except (UnicodeEncodeError, struct.error) as e:
+                    # nothing was sent, keep reading the responses in flight
+                    results[index] = e
+                    continue
+                self._next_id = (self._next_id + 1) & 0xFFFFFFFF
+                self._sock.sendall(request)
+                in_flight.append((request_id, index))
+
+            while in_flight:
+                self._receive(*in_flight.popleft(), results)
+        except BaseException:
+            # unread responses would be taken for the ones of the next requests
+            self.close()
+            raise
+
+        return results
+
+    def _receive(self, expected_id: int, index: int, results: List[Union[List[str], Exception]]) -> None:
+        """
+        Read the response to the request expected_id and store its languages,
+        or the error of the server, in results[index].
+        """
+        try:
+            request_id, status, payload = _read_response(self._rfile)
+        except EOFError:
+            raise ServerError("the enry worker closed the connection") from None
+        if request_id != expected_id:
+            raise ServerError(f"unexpected response {request_id}, waiting for {expected_id}")
+        if status != STATUS_OK:
+            results[index] = ServerError(payload.decode())
+        else:
+            results[index] = payload.decode().split("\0") if payload else []
+
+    def close(self) -> None:
+        self._rfile.close()
+        self._sock.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _serve_connection(conn: socket.socket, latency: LatencyHistogram, lock: threading.Lock) -> None:
+    from enry.definitions import GetLanguages, GetLanguagesWithMargin
+
+    with conn, conn.makefile("rb") as rfile, conn.makefile("wb") as wfile:
+        while True:
+            try:
+                request = _read_request(rfile)
+            except EOFError:
+                return
+            if request is None:
+                return
+
+            request_id, op, margin, filename, content = request
+            start = time.perf_counter()
+            try:
+                if op != OP_GET_LANGUAGES:
+                    raise ValueError(f"unsupported op {op}")
+                filename = filename.decode("utf-8", "surrogateescape")
+                if margin > 0:
+                    languages = GetLanguagesWithMargin(filename, content, margin)
+                else:
+                    languages = GetLanguages(filename, content)
+                status, payload = STATUS_OK, "\0".join(languages).encode()
+            except Exception as e:
+                status, payload = STATUS_ERROR, str(e).encode("utf-8", "replace")
+            elapsed = time.perf_counter() - start
+
+            with lock:
+                latency.record(elapsed)
+            try:
+                _write_response(wfile, request_id, status, payload)
+            except OSError:
+                return
+
+
+def _accept_connections(listener: socket.socket, latency: LatencyHistogram, lock: threading.Lock) -> None:
+    while True:
+        conn, _ = listener.accept()
+        threading.Thread(target=_serve_connection, args=(conn, latency, lock), daemon=True).start()
+
+
+def serve_worker(listener_fd: int) -> None:
+    """
+    Run a worker process: serve connections accepted on the inherited
+    listener_fd and answer stats requests on stdin, until stdin is closed.
+    """
+    import enry.definitions  # noqa: F401, loads the library and starts the Go runtime
+
+    control_in, control_out = sys.stdin.buffer, sys.stdout.buffer
+    listener = socket.socket(fileno=listener_fd)
+    latency = LatencyHistogram()
+    lock = threading.Lock()
+    threading.Thread(target=_accept_connections, args=(listener, latency, lock), daemon=True).start()
+
+    _write_response(control_out, 0, STATUS_OK, b"")
+    while True:
+        request = _read_request(control_in)
+        if request is None:
+            return
+        with lock:
+            payload = latency.pack()
+        _write_response(control_out, request[0], STATUS_OK, payload)
+
+
+def _forget_servers_in_child() -> None:
+    for server in list(_servers):
+        server._forget()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_servers_in_child)
+
+
+if __name__ == "__main__":
+    serve_worker(int(sys.argv[1]))
@@ -4,3 +4,14 @@ from typing import NamedTuple
 class Guess(NamedTuple):
     language: str
     safe: bool
+
+
+class ClassifierCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
@@ -1,5 +1,5 @@
 from _c_enry import ffi
-from enry.types import Guess
+from enry.types import ClassifierCacheStats, Guess
 from functools import wraps
 from typing import Hashable, List, Sequence
 
@@ -11,12 +11,17 @@ def py_bytes_to_go(py_bytes: bytes):
 
 
 def py_str_to_go(py_str: str):
-    str_bytes = py_str.encode()
+    # file names from os functions may hold undecodable bytes as surrogates
+    str_bytes = py_str.encode("utf-8", "surrogateescape")
     c_str = ffi.new("char[]", str_bytes)
     go_str = ffi.new("_GoString_ *", [c_str, len(str_bytes)])
     return (go_str[0], c_str)
 
 
+def py_float_to_go(py_float: float):
+    return (py_float, None)
+
+
 def go_str_to_py(go_str: str):
     str_len = go_str.n
     if str_len > 0:
@@ -42,9 +47,14 @@ def go_guess_to_py(guess) -> Guess:
     return Guess(go_str_to_py(guess.r0), go_bool_to_py(guess.r1))
 
 
+def go_classifier_cache_stats_to_py(stats) -> ClassifierCacheStats:
+    return ClassifierCacheStats(stats.r0, stats.r1, stats.r2)
+
+
 py_to_go = {
     str: py_str_to_go,
     bytes: py_bytes_to_go,
+    float: py_float_to_go,
 }
 
 
@@ -52,6 +62,7 @@ go_to_py = {
     str: go_str_to_py,
     bool: go_bool_to_py,
     Guess: go_guess_to_py,
+    ClassifierCacheStats: go_classifier_cache_stats_to_py,
 }
 
 
@@ -12,6 +12,15 @@ def test_get_language(filename: str, content: str, language: str):
     assert get_language(filename, content.encode()) == language
 
 
+@pytest.mark.parametrize("filename,content,language", [
+    ("test.py", "import os", "Python"),
+    pytest.param("test.cgi", "use strict;\nmy $name = shift;\n" * 2000, "Perl", id="big-ambiguous"),
+])
+def test_get_language_with_margin(filename: str, content: str, language: str):
+    assert get_language(filename, content.encode(), max_confidence_margin=10) == language
+    assert get_languages(filename, content.encode(), max_confidence_margin=10)[0] == language
+
+
 def test_get_language_by_filename():
     assert get_language_by_filename("pom.xml").language == "Maven POM"
 
@@ -100,3 +109,17 @@ def test_get_language_extensions():
     assert get_language_extensions("Python") == [".py", ".cgi", ".fcgi", ".gyp", ".gypi", ".lmi", ".py3", ".pyde",
                                                  ".pyi", ".pyp", ".pyt", ".pyw", ".rpy", ".spec", ".tac",
                                                  ".wsgi", ".xpy"]
+
+
+def test_classifier_cache():
+    content = "my $name = shift;\nprint \"Hello, $name\\n\";\n".encode()
+    enable_classifier_cache(16)
+    try:
+        first = get_languages("a.cgi", content)
+        assert get_languages("b.cgi", content) == first
+        stats = get_classifier_cache_stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+    finally:
+        disable_classifier_cache()
+    assert get_classifier_cache_stats() == (0, 0, 0)
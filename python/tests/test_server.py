@@ -0,0 +1,129 @@
+import socket
+import struct
+import subprocess
+import sys
+import textwrap
+
+from enry import get_languages
+from enry.server import OP_GET_LANGUAGES, REQUEST_HEADER, STATUS_ERROR, STATUS_OK, Client, Server, ServerError, _read_response
+
+import pytest
+
+FILES = [
+    ("test.py", b"import os"),
+    ("", b"#!/usr/bin/bash"),
+    ("test.hs", b""),
+    ("test.h", b"#include <stdio.h>\nint main(void);\n"),
+    ("pom.xml", b""),
+]
+
+
+@pytest.fixture(scope="module")
+def server(tmp_path_factory):
+    with Server(str(tmp_path_factory.mktemp("server") / "enry.sock"), workers=2) as server:
+        yield server
+
+
+def test_server_get_languages(server):
+    with Client(server.path) as client:
+        for filename, content in FILES:
+            assert client.get_languages(filename, content) == get_languages(filename, content)
+        assert client.get_language("test.py", b"import os") == "Python"
+        assert client.get_language("test.py", b"import os", max_confidence_margin=10) == "Python"
+
+
+def test_server_pipelining(server):
+    files = FILES * 50
+    with Client(server.path, window=8) as client:
+        assert client.get_languages_batch(files) == [get_languages(*file) for file in files]
+
+
+def test_server_stats(server):
+    before = sum(stats.latency.count for stats in server.stats())
+    with Client(server.path) as client:
+        client.get_languages_batch(FILES)
+
+    stats = server.stats()
+    assert len(stats) == 2
+    assert sum(s.latency.count for s in stats) == before + len(FILES)
+    assert all(s.latency.percentile(99) >= s.latency.percentile(50) for s in stats)
+
+
+def test_server_does_not_load_go_in_master():
+    code = "import sys, enry.server; assert '_c_enry' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_server_error_in_batch(server):
+    files = FILES + [("\ud800.py", b"import os"), ("a" * 0x10000 + ".py", b"import os")] + FILES
+    with Client(server.path, window=4) as client:
+        results = client.get_languages_batch(files)
+        with pytest.raises(UnicodeEncodeError):
+            client.get_languages("\ud800.py", b"import os")
+
+    assert len(results) == len(files)
+    assert isinstance(results[len(FILES)], UnicodeEncodeError)
+    assert isinstance(results[len(FILES) + 1], struct.error)
+    # the files around the failed ones still have their result
+    expected = [get_languages(*file) for file in FILES]
+    assert results[:len(FILES)] == expected
+    assert results[len(FILES) + 2:] == expected
+
+
+def test_server_replaces_stale_socket(tmp_path):
+    path = str(tmp_path / "enry.sock")
+    # the socket of a master killed before it could close its Server
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(path)
+    with Server(path, workers=1) as server, Client(server.path) as client:
+        assert client.get_language("test.py", b"import os") == "Python"
+
+
+def test_server_undecodable_filename(server):
+    with Client(server.path) as client:
+        assert client.get_language("\udcff.py", b"import os") == "Python"
+
+
+def test_server_invalid_request(server):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(server.path)
+        with sock.makefile("rb") as rfile:
+            sock.sendall(REQUEST_HEADER.pack(1, 0, 0, 0, 0))
+            request_id, status, payload = _read_response(rfile)
+            assert (request_id, status) == (1, STATUS_ERROR)
+            assert payload
+
+            # the connection is still usable, and file names need not be UTF-8
+            filename = b"\xff.py"
+            sock.sendall(REQUEST_HEADER.pack(2, OP_GET_LANGUAGES, 0, len(filename), 0) + filename)
+            assert _read_response(rfile) == (2, STATUS_OK, b"Python")
+
+
+def test_server_close_with_forked_children(tmp_path):
+    code = textwrap.dedent("""
+        import os, sys, time
+        from enry.server import Client, Server
+
+        server = Server(sys.argv[1], workers=2)
+        workers = list(server._workers)
+        ready_r, ready_w = os.pipe()
+        done_r, done_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            with Client(server.path) as client:
+                ok = client.get_language("test.py", b"import os") == "Python"
+            os.write(ready_w, b"1" if ok else b"0")
+            os.read(done_r, 1)
+            os._exit(0)
+
+        assert os.read(ready_r, 1) == b"1"
+        assert os.path.exists(server.path)
+        start = time.monotonic()
+        server.close()
+        elapsed = time.monotonic() - start
+        os.write(done_w, b"x")
+        os.waitpid(pid, 0)
+        assert elapsed < 3, elapsed
+        assert [worker.returncode for worker in workers] == [0, 0]
+    """)
+    subprocess.run([sys.executable, "-c", code, str(tmp_path / "enry.sock")], check=True, timeout=60)
@@ -0,0 +1,42 @@
+package regex
+
+import "sync"
+
+// LazyRegexp is a regular expression that is compiled on its first use.
+// It lets generated tables with hundreds of expressions be declared at
+// package level without paying for their compilation at init time.
+type LazyRegexp struct {
+	expr    string
+	compile func(string) EnryRegexp
+
+	once sync.Once
+	re   EnryRegexp
+}
+
+// MustCompileLazy is a lazy counterpart of MustCompile.
+func MustCompileLazy(s string) *LazyRegexp {
+	return &LazyRegexp{expr: s, compile: MustCompile}
+}
+
+// MustCompileMultilineLazy is a lazy counterpart of MustCompileMultiline.
+func MustCompileMultilineLazy(s string) *LazyRegexp {
+	return &LazyRegexp{expr: s, compile: MustCompileMultiline}
+}
+
+// Regexp compiles the expression, if it was not compiled yet, and returns it.
+func (r *LazyRegexp) Regexp() EnryRegexp {
+	r.once.Do(func() {
+		r.re = r.compile(r.expr)
+	})
+	return r.re
+}
+
+// Match reports whether data contains any match of the expression.
+func (r *LazyRegexp) Match(data []byte) bool {
+	return r.Regexp().Match(data)
+}
+
+// MatchString reports whether s contains any match of the expression.
+func (r *LazyRegexp) MatchString(s string) bool {
+	return r.Regexp().MatchString(s)
+}
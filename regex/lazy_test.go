@@ -0,0 +1,34 @@
+package regex
+
+import (
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestMustCompileLazy(t *testing.T) {
+	lazy := MustCompileLazy(`b+`)
+	assert.Nil(t, lazy.re, "must not be compiled before the first use")
+	assert.True(t, lazy.MatchString("abbc"))
+	assert.False(t, lazy.Match([]byte("ac")))
+	assert.Same(t, lazy.Regexp(), lazy.Regexp())
+}
+
+func TestMustCompileMultilineLazy(t *testing.T) {
+	const re = `^\.(.*)!$`
+	lazy := MustCompileMultilineLazy(re)
+	assert.True(t, lazy.MatchString(".one\n.two!\nthre!"))
+	assert.False(t, lazy.MatchString(".one\nthree!"))
+}
+
+func TestMustCompileRubyLazy(t *testing.T) {
+	lazy := MustCompileRubyLazy(`(?<!b)a`)
+	if Name == RE2 {
+		assert.Nil(t, lazy, "RE2 does not support the syntax")
+		return
+	}
+
+	assert.Nil(t, lazy.re, "must not be compiled before the first use")
+	assert.True(t, lazy.MatchString("ca"))
+	assert.False(t, lazy.MatchString("ba"))
+}
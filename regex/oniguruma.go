@@ -24,6 +24,11 @@ func MustCompileRuby(s string) EnryRegexp {
 	return MustCompile(s)
 }
 
+// MustCompileRubyLazy is a lazy counterpart of MustCompileRuby.
+func MustCompileRubyLazy(s string) *LazyRegexp {
+	return &LazyRegexp{expr: s, compile: MustCompileRuby}
+}
+
 func QuoteMeta(s string) string {
 	return rubex.QuoteMeta(s)
 }
@@ -33,6 +33,12 @@ func MustCompileRuby(s string) EnryRegexp {
 	return nil
 }
 
+// MustCompileRubyLazy is a lazy counterpart of MustCompileRuby.
+// As MustCompileRuby, it returns nil, as RE2 does not support the syntax.
+func MustCompileRubyLazy(s string) *LazyRegexp {
+	return nil
+}
+
 func QuoteMeta(s string) string {
 	return regexp.QuoteMeta(s)
 }
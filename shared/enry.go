@@ -12,6 +12,11 @@ func GetLanguage(filename string, content []byte) string {
 	return enry.GetLanguage(filename, content)
 }
 
+//export GetLanguageWithMargin
+func GetLanguageWithMargin(filename string, content []byte, margin float64) string {
+	return enry.GetLanguageWithMargin(filename, content, margin)
+}
+
 //export GetLanguageByContent
 func GetLanguageByContent(filename string, content []byte) (language string, safe bool) {
 	return enry.GetLanguageByContent(filename, content)
@@ -57,6 +62,11 @@ func GetLanguages(filename string, content []byte, result *[]*C.char) {
 	strSliceCopy(result, enry.GetLanguages(filename, content))
 }
 
+//export GetLanguagesWithMargin
+func GetLanguagesWithMargin(filename string, content []byte, margin float64, result *[]*C.char) {
+	strSliceCopy(result, enry.GetLanguagesWithMargin(filename, content, margin))
+}
+
 //export GetLanguagesByContent
 func GetLanguagesByContent(filename string, content []byte, candidates []string, result *[]*C.char) {
 	strSliceCopy(result, enry.GetLanguagesByContent(filename, content, candidates))
@@ -147,6 +157,22 @@ func GetLanguageType(language string) string {
 	return data.Type(enry.GetLanguageType(language)).String()
 }
 
+//export EnableClassifierCache
+func EnableClassifierCache(size, prefixBytes int) {
+	enry.EnableClassifierCache(size, prefixBytes)
+}
+
+//export DisableClassifierCache
+func DisableClassifierCache() {
+	enry.DisableClassifierCache()
+}
+
+//export GetClassifierCacheStats
+func GetClassifierCacheStats() (hits, misses, size int) {
+	stats := enry.GetClassifierCacheStats()
+	return int(stats.Hits), int(stats.Misses), stats.Size
+}
+
 func strSliceCopy(result *[]*C.char, slice []string) {
 	for _, str := range slice {
 		*result = append(*result, C.CString(str))